@@ -0,0 +1,46 @@
+"""Promote hot verification keys to indexed columns
+
+Revision ID: 002_promote_stage_metrics
+Revises: 001_initial_pipeline
+Create Date: 2026-10-16
+
+- stage_executions: tests_passed, lint_errors, health_score promoted out of
+  the `output` JSON blob (backfilled from existing rows)
+- handoff_tokens: btree index on trust_score
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002_promote_stage_metrics'
+down_revision = '001_initial_pipeline'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('stage_executions', sa.Column('tests_passed', sa.Integer(), nullable=True))
+    op.add_column('stage_executions', sa.Column('lint_errors', sa.Integer(), nullable=True))
+    op.add_column('stage_executions', sa.Column('health_score', sa.Numeric(precision=5, scale=2), nullable=True))
+
+    # Backfill from the existing JSON output
+    op.execute("""
+        UPDATE stage_executions
+        SET tests_passed = (output->>'tests_passed')::integer,
+            lint_errors = (output->>'lint_errors')::integer,
+            health_score = round((output->>'health_score')::numeric, 2)
+        WHERE output IS NOT NULL
+    """)
+
+    op.create_index('ix_stage_executions_health_score', 'stage_executions', ['health_score'], unique=False)
+    op.create_index('ix_handoff_tokens_trust_score', 'handoff_tokens', ['trust_score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_handoff_tokens_trust_score', table_name='handoff_tokens')
+    op.drop_index('ix_stage_executions_health_score', table_name='stage_executions')
+    op.drop_column('stage_executions', 'health_score')
+    op.drop_column('stage_executions', 'lint_errors')
+    op.drop_column('stage_executions', 'tests_passed')
@@ -0,0 +1,97 @@
+"""Hash-partition cc_session_outputs by session_id
+
+Revision ID: 003_partition_cc_outputs
+Revises: 002_promote_stage_metrics
+Create Date: 2026-10-16
+
+- cc_session_outputs becomes PARTITION BY HASH (session_id), 16 partitions
+- surrogate `id` dropped; primary key is (session_id, line_number)
+  (a partitioned table's PK must include the partition key)
+- refuses to run while any (session_id, line_number) has more than one row,
+  instead of choosing which duplicate to keep
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_partition_cc_outputs'
+down_revision = '002_promote_stage_metrics'
+branch_labels = None
+depends_on = None
+
+PARTITIONS = 16
+
+
+def upgrade() -> None:
+    pairs, extra_rows = op.get_bind().execute(sa.text("""
+        SELECT count(*), coalesce(sum(n - 1), 0) FROM (
+            SELECT count(*) AS n FROM cc_session_outputs
+            GROUP BY session_id, line_number
+            HAVING count(*) > 1
+        ) AS duplicates
+    """)).one()
+    if pairs:
+        raise RuntimeError(
+            f"cc_session_outputs has {pairs} duplicated (session_id, line_number) "
+            f"pairs ({extra_rows} extra rows); they can't share the new primary key. "
+            "Delete or renumber them, then rerun the upgrade."
+        )
+
+    op.rename_table('cc_session_outputs', 'cc_session_outputs_old')
+    op.drop_index('ix_cc_session_outputs_session_id', table_name='cc_session_outputs_old')
+
+    op.create_table(
+        'cc_session_outputs',
+        sa.Column('session_id', sa.UUID(), nullable=False),
+        sa.Column('line_number', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('is_error', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('is_completion_marker', sa.Boolean(), nullable=False, server_default='false'),
+        sa.ForeignKeyConstraint(['session_id'], ['cc_sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('session_id', 'line_number'),
+        postgresql_partition_by='HASH (session_id)',
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE cc_session_outputs_p{remainder} "
+            f"PARTITION OF cc_session_outputs "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+    op.create_index('ix_cc_session_outputs_session_id', 'cc_session_outputs', ['session_id'], unique=False)
+
+    op.execute("""
+        INSERT INTO cc_session_outputs
+            (session_id, line_number, content, timestamp, is_error, is_completion_marker)
+        SELECT session_id, line_number, content, timestamp, is_error, is_completion_marker
+        FROM cc_session_outputs_old
+    """)
+    op.drop_table('cc_session_outputs_old')
+
+
+def downgrade() -> None:
+    op.rename_table('cc_session_outputs', 'cc_session_outputs_new')
+
+    op.create_table(
+        'cc_session_outputs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('session_id', sa.UUID(), nullable=False),
+        sa.Column('line_number', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('is_error', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('is_completion_marker', sa.Boolean(), nullable=False, server_default='false'),
+        sa.ForeignKeyConstraint(['session_id'], ['cc_sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("""
+        INSERT INTO cc_session_outputs
+            (session_id, line_number, content, timestamp, is_error, is_completion_marker)
+        SELECT session_id, line_number, content, timestamp, is_error, is_completion_marker
+        FROM cc_session_outputs_new
+        ORDER BY session_id, line_number
+    """)
+    op.drop_table('cc_session_outputs_new')
+    op.create_index('ix_cc_session_outputs_session_id', 'cc_session_outputs', ['session_id'], unique=False)
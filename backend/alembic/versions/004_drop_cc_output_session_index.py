@@ -0,0 +1,25 @@
+"""Drop redundant cc_session_outputs.session_id index
+
+Revision ID: 004_drop_cc_output_session_idx
+Revises: 003_partition_cc_outputs
+Create Date: 2026-10-16
+
+The (session_id, line_number) primary key already serves every
+session_id lookup, so the single-column btree is pure write overhead.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004_drop_cc_output_session_idx'
+down_revision = '003_partition_cc_outputs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_cc_session_outputs_session_id', table_name='cc_session_outputs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_cc_session_outputs_session_id', 'cc_session_outputs', ['session_id'], unique=False)
@@ -0,0 +1,94 @@
+"""Replace PostgreSQL ENUM types with VARCHAR + CHECK
+
+Revision ID: 005_varchar_enums
+Revises: 004_drop_cc_output_session_idx
+Create Date: 2026-10-16
+
+- pipeline / CC session enum columns become VARCHAR(32) with a CHECK
+  constraint; the native ENUM types are dropped
+- partial index on pipeline_runs.current_stage for running runs
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005_varchar_enums'
+down_revision = '004_drop_cc_output_session_idx'
+branch_labels = None
+depends_on = None
+
+
+ENUM_VALUES = {
+    'pipelinestage': ('queued', 'developing', 'testing', 'verifying',
+                      'po_review', 'deploying', 'completed', 'failed', 'cancelled'),
+    'pipelinerunstatus': ('running', 'paused', 'completed', 'failed', 'cancelled'),
+    'escalationlevel': ('codex', 'sonnet', 'opus', 'human'),
+    'guardraillayer': ('invariant', 'contract', 'policy', 'preference'),
+    'resourcetype': ('frontend_port', 'backend_port', 'database_port', 'redis_port', 'test_port'),
+    'epochstatus': ('active', 'completed', 'deprecated'),
+    'ccsessionstatus': ('idle', 'starting', 'running', 'stuck',
+                        'completed', 'failed', 'crashed', 'restarting'),
+    'ccsessionplatform': ('windows', 'linux', 'wsl'),
+}
+
+# (table, column, enum type, server default)
+ENUM_COLUMNS = [
+    ('epochs', 'status', 'epochstatus', 'active'),
+    ('pipeline_runs', 'current_stage', 'pipelinestage', 'queued'),
+    ('pipeline_runs', 'status', 'pipelinerunstatus', 'running'),
+    ('pipeline_runs', 'escalation_level', 'escalationlevel', 'codex'),
+    ('stage_executions', 'stage', 'pipelinestage', None),
+    ('handoff_tokens', 'from_stage', 'pipelinestage', None),
+    ('handoff_tokens', 'to_stage', 'pipelinestage', None),
+    ('guardrail_violations', 'layer', 'guardraillayer', None),
+    ('resource_allocations', 'resource_type', 'resourcetype', None),
+    ('cc_sessions', 'platform', 'ccsessionplatform', None),
+    ('cc_sessions', 'status', 'ccsessionstatus', 'idle'),
+]
+
+
+def upgrade() -> None:
+    for table, column, enum_name, default in ENUM_COLUMNS:
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR(32) USING {column}::text"
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+
+        allowed = ", ".join(f"'{v}'" for v in ENUM_VALUES[enum_name])
+        op.create_check_constraint(
+            f'ck_{table}_{column}', table, f"{column} IN ({allowed})"
+        )
+
+    for enum_name in ENUM_VALUES:
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+    op.execute(
+        "CREATE INDEX ix_pipeline_runs_running_stage ON pipeline_runs (current_stage) "
+        "WHERE status = 'running'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipeline_runs_running_stage', table_name='pipeline_runs')
+
+    for enum_name, values in ENUM_VALUES.items():
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({allowed})")
+
+    for table, column, enum_name, default in ENUM_COLUMNS:
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::{enum_name}"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT '{default}'::{enum_name}"
+            )
@@ -0,0 +1,40 @@
+"""Server-side UUID defaults for pipeline / CC session primary keys
+
+Revision ID: 006_server_uuid_defaults
+Revises: 005_varchar_enums
+Create Date: 2026-10-16
+
+- id columns default to gen_random_uuid() (built in since PostgreSQL 13),
+  so INSERT ... SELECT / COPY paths can omit the key. ORM inserts still
+  supply a client-side UUIDv7.
+- po_review_requests is not migration-managed (created by init_db), it
+  picks the default up from the model
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_server_uuid_defaults'
+down_revision = '005_varchar_enums'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'pipeline_runs',
+    'stage_executions',
+    'handoff_tokens',
+    'guardrail_violations',
+    'resource_allocations',
+    'cc_sessions',
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,59 @@
+"""Store 0-100 scores as SMALLINT hundredths instead of NUMERIC(5,2)
+
+Revision ID: 007_scaled_score_columns
+Revises: 006_server_uuid_defaults
+Create Date: 2026-10-16
+
+- score columns become SMALLINT holding score * 100, with a
+  CHECK (col BETWEEN 0 AND 10000)
+- po_review_requests is created by init_db, not migrations, and is left
+  to the model definition
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_scaled_score_columns'
+down_revision = '006_server_uuid_defaults'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default)
+SCORE_COLUMNS = [
+    ('pipeline_runs', 'final_trust_score', None),
+    ('stage_executions', 'health_score', None),
+    ('handoff_tokens', 'trust_score', None),
+    ('handoff_tokens', 'tests_score', '0'),
+    ('handoff_tokens', 'lint_score', '0'),
+    ('handoff_tokens', 'health_score', '0'),
+    ('handoff_tokens', 'console_score', '0'),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in SCORE_COLUMNS:
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE SMALLINT USING round({column} * 100)::smallint"
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
+        op.create_check_constraint(
+            f'ck_{table}_{column}', table, f"{column} BETWEEN 0 AND 10000"
+        )
+
+
+def downgrade() -> None:
+    for table, column, default in SCORE_COLUMNS:
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE NUMERIC(5, 2) USING ({column}::numeric / 100)"
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default}")
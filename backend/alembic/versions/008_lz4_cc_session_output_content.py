@@ -0,0 +1,38 @@
+"""LZ4-compress cc_session_outputs.content
+
+Revision ID: 008_lz4_cc_output_content
+Revises: 007_scaled_score_columns
+Create Date: 2026-10-16
+
+- content column compression switched from pglz to lz4 (PostgreSQL 14+)
+- partitions get toast_tuple_target = 128 so short output lines are
+  considered for compression too
+- only newly written rows are affected; existing values keep pglz until
+  rewritten
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_lz4_cc_output_content'
+down_revision = '007_scaled_score_columns'
+branch_labels = None
+depends_on = None
+
+PARTITIONS = 16
+TOAST_TUPLE_TARGET = 128
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE cc_session_outputs ALTER COLUMN content SET COMPRESSION lz4")
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"ALTER TABLE cc_session_outputs_p{remainder} "
+            f"SET (toast_tuple_target = {TOAST_TUPLE_TARGET})"
+        )
+
+
+def downgrade() -> None:
+    for remainder in range(PARTITIONS):
+        op.execute(f"ALTER TABLE cc_session_outputs_p{remainder} RESET (toast_tuple_target)")
+    op.execute("ALTER TABLE cc_session_outputs ALTER COLUMN content SET COMPRESSION pglz")
@@ -0,0 +1,47 @@
+"""BRIN indexes on append-ordered timestamp columns
+
+Revision ID: 009_brin_timestamp_indexes
+Revises: 008_lz4_cc_output_content
+Create Date: 2026-10-16
+
+- BRIN (pages_per_range = 32) on created_at for pipeline_runs,
+  stage_executions, guardrail_violations, cc_sessions and on
+  cc_session_outputs.timestamp
+- columns are already timestamptz with a now() server default; there are
+  no btree indexes on them to drop
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_brin_timestamp_indexes'
+down_revision = '008_lz4_cc_output_content'
+branch_labels = None
+depends_on = None
+
+
+# (table, column)
+BRIN_COLUMNS = [
+    ('pipeline_runs', 'created_at'),
+    ('stage_executions', 'created_at'),
+    ('guardrail_violations', 'created_at'),
+    ('cc_sessions', 'created_at'),
+    ('cc_session_outputs', 'timestamp'),
+]
+
+
+def upgrade() -> None:
+    for table, column in BRIN_COLUMNS:
+        op.create_index(
+            f'ix_{table}_{column}_brin',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade() -> None:
+    for table, column in BRIN_COLUMNS:
+        op.drop_index(f'ix_{table}_{column}_brin', table_name=table)
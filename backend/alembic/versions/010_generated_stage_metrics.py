@@ -0,0 +1,65 @@
+"""Derive promoted stage metrics from the output blob
+
+Revision ID: 010_generated_stage_metrics
+Revises: 009_brin_timestamp_indexes
+Create Date: 2026-10-16
+
+- stage_executions.tests_passed / lint_errors / health_score become STORED
+  generated columns over `output`, so the values are no longer written
+  twice by the application; malformed keys become NULL instead of
+  aborting the write
+- PostgreSQL can't turn a plain column into a generated one in place, so
+  each column is dropped and re-added; the health_score index and CHECK go
+  with the column and are recreated
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_generated_stage_metrics'
+down_revision = '009_brin_timestamp_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Keys that aren't a value of the expected shape (3.0, "n/a", a score above
+# 100, ...) yield NULL rather than failing the INSERT/UPDATE. CASEs are
+# nested because PostgreSQL doesn't promise to evaluate AND left to right.
+INT_EXPRESSION = (
+    "CASE WHEN (output ->> '{key}') ~ '^-?[0-9]{{1,9}}$' "
+    "THEN CAST(output ->> '{key}' AS INTEGER) END"
+)
+SCORE_EXPRESSION = (
+    "CASE WHEN (output ->> '{key}') ~ '^[0-9]{{1,3}}([.][0-9]+)?([eE]-[0-9]+)?$' "
+    "THEN CASE WHEN CAST(output ->> '{key}' AS FLOAT) <= 100 "
+    "THEN CAST(round(CAST(output ->> '{key}' AS FLOAT) * 100) AS SMALLINT) END END"
+)
+
+# (column, type, generated expression)
+GENERATED_COLUMNS = [
+    ('tests_passed', 'INTEGER', INT_EXPRESSION.format(key='tests_passed')),
+    ('lint_errors', 'INTEGER', INT_EXPRESSION.format(key='lint_errors')),
+    ('health_score', 'SMALLINT', SCORE_EXPRESSION.format(key='health_score')),
+]
+
+
+def upgrade() -> None:
+    for column, sqltype, expression in GENERATED_COLUMNS:
+        op.execute(f"ALTER TABLE stage_executions DROP COLUMN {column}")
+        op.execute(
+            f"ALTER TABLE stage_executions ADD COLUMN {column} {sqltype} "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+
+    op.create_check_constraint(
+        'ck_stage_executions_health_score', 'stage_executions',
+        "health_score BETWEEN 0 AND 10000",
+    )
+    op.create_index('ix_stage_executions_health_score', 'stage_executions', ['health_score'], unique=False)
+
+
+def downgrade() -> None:
+    # Keeps the current values, index and CHECK; the columns just stop
+    # being derived
+    for column, _, _ in GENERATED_COLUMNS:
+        op.execute(f"ALTER TABLE stage_executions ALTER COLUMN {column} DROP EXPRESSION")
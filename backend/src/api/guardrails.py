@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, strict_load
 from src.core.models import GuardrailViolation, GuardrailLayer
 from src.core.pipeline import GuardrailsEngine
 
@@ -346,7 +346,12 @@ async def get_violations(
         blocked_only: Only show blocked violations
         limit: Maximum results
     """
-    query = select(GuardrailViolation).order_by(GuardrailViolation.created_at.desc()).limit(limit)
+    query = (
+        select(GuardrailViolation)
+        .options(*strict_load())
+        .order_by(GuardrailViolation.created_at.desc())
+        .limit(limit)
+    )
 
     if layer:
         try:
@@ -177,7 +177,7 @@ async def get_recent_events(limit: int = 20) -> List[EventResponse]:
     manager = get_connection_manager()
     
     events = []
-    for event in manager.event_history[-limit:]:
+    for event in list(manager.event_history)[-limit:]:
         events.append(EventResponse(
             id=event.id,
             timestamp=event.timestamp,
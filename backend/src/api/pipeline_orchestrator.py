@@ -11,8 +11,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
 
-from src.core.database import get_db
+from src.core.database import get_db, strict_load
 from src.core.models import (
     PipelineRun,
     PipelineRunStatus,
@@ -79,6 +80,9 @@ class StageExecutionResponse(BaseModel):
     duration_seconds: Optional[int]
     agent_used: Optional[str]
     retry_attempt: int
+    tests_passed: Optional[int]
+    lint_errors: Optional[int]
+    health_score: Optional[float]
     output: Optional[dict]
     error_message: Optional[str]
 
@@ -158,7 +162,12 @@ async def list_pipeline_runs(
         stage: Filter by current stage
         limit: Maximum number of results
     """
-    query = select(PipelineRun).order_by(PipelineRun.created_at.desc()).limit(limit)
+    query = (
+        select(PipelineRun)
+        .options(*strict_load())
+        .order_by(PipelineRun.created_at.desc())
+        .limit(limit)
+    )
 
     if status:
         try:
@@ -214,6 +223,7 @@ async def get_stage_executions(
     """Get all stage executions for a pipeline run."""
     result = await db.execute(
         select(StageExecution)
+        .options(*strict_load(undefer_group("bulk")))
         .where(StageExecution.pipeline_run_id == run_id)
         .order_by(StageExecution.created_at)
     )
@@ -230,6 +240,7 @@ async def get_handoff_tokens(
     """Get all handoff tokens for a pipeline run."""
     result = await db.execute(
         select(HandoffToken)
+        .options(*strict_load())
         .where(HandoffToken.pipeline_run_id == run_id)
         .order_by(HandoffToken.created_at)
     )
@@ -473,6 +484,9 @@ def _execution_to_response(ex: StageExecution) -> StageExecutionResponse:
         duration_seconds=ex.duration_seconds,
         agent_used=ex.agent_used,
         retry_attempt=ex.retry_attempt,
+        tests_passed=ex.tests_passed,
+        lint_errors=ex.lint_errors,
+        health_score=float(ex.health_score) if ex.health_score is not None else None,
         output=ex.output,
         error_message=ex.error_message,
     )
@@ -7,19 +7,21 @@ REST endpoints for Product Owner review management.
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from src.core.database import get_db
+from src.core.database import get_db, strict_load
 from src.core.models import (
     PipelineRun,
     PipelineRunStatus,
     PipelineStage,
     POReviewRequest,
+    uuid7,
 )
 
 router = APIRouter(prefix="/api/v1/po-review", tags=["po-review"])
@@ -101,6 +103,7 @@ async def get_review_queue(
     # Get pipeline runs in PO_REVIEW stage
     query = (
         select(PipelineRun)
+        .options(*strict_load(selectinload(PipelineRun.resource_allocations)))
         .where(PipelineRun.current_stage == PipelineStage.PO_REVIEW)
         .where(PipelineRun.status == PipelineRunStatus.RUNNING)
     )
@@ -140,7 +143,9 @@ async def get_review_item(
 ):
     """Get a specific review item by pipeline run ID."""
     result = await db.execute(
-        select(PipelineRun).where(PipelineRun.id == run_id)
+        select(PipelineRun)
+        .options(selectinload(PipelineRun.resource_allocations))
+        .where(PipelineRun.id == run_id)
     )
     run = result.scalar_one_or_none()
 
@@ -326,7 +331,9 @@ async def _get_run_and_review(
 ) -> tuple[PipelineRun, POReviewRequest]:
     """Get pipeline run and its review request."""
     run_result = await db.execute(
-        select(PipelineRun).where(PipelineRun.id == run_id)
+        select(PipelineRun)
+        .options(selectinload(PipelineRun.resource_allocations))
+        .where(PipelineRun.id == run_id)
     )
     run = run_result.scalar_one_or_none()
 
@@ -379,7 +386,7 @@ async def _create_review_request(
                 break
 
     review = POReviewRequest(
-        id=uuid4(),
+        id=uuid7(),
         pipeline_run_id=run.id,
         status="pending",
         health_score=Decimal(str(health_score)),
@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, strict_load
 from src.core.models import ResourceAllocation, ResourceType
 from src.core.pipeline import ResourceManager
 
@@ -153,7 +153,7 @@ async def list_all_allocations(
         category: Filter by category
         limit: Maximum results
     """
-    query = select(ResourceAllocation).limit(limit)
+    query = select(ResourceAllocation).options(*strict_load()).limit(limit)
 
     if active_only:
         query = query.where(ResourceAllocation.is_active == True)
@@ -9,7 +9,7 @@ Uses pydantic-settings for validation and type conversion.
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import RedisDsn, computed_field
+from pydantic import RedisDsn, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -41,10 +41,19 @@ class Settings(BaseSettings):
     # Database (supports SQLite and PostgreSQL)
     # ==========================================================================
     DATABASE_URL: str = "sqlite+aiosqlite:///./nhmc.db"
-    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
     DATABASE_ECHO: bool = False
 
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def use_async_driver(cls, v: str) -> str:
+        """Route plain/psycopg2 PostgreSQL URLs through asyncpg (the engine is async-only)."""
+        for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+            if v.startswith(prefix):
+                return "postgresql+asyncpg://" + v[len(prefix):]
+        return v
+
     @computed_field  # type: ignore[misc]
     @property
     def is_sqlite(self) -> bool:
@@ -14,14 +14,25 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import MetaData
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.core.config import settings
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # SQLAlchemy's default "ix" plus per-column CHECK names, so two enum
+    # columns of the same type on one table (e.g. from_stage/to_stage) don't
+    # collide. PKs, FKs and UNIQUEs keep PostgreSQL's default names, matching
+    # the databases built by migration 001.
+    metadata = MetaData(naming_convention={
+        "ix": "ix_%(column_0_label)s",
+        "ck": "ck_%(table_name)s_%(column_0_name)s",
+    })
 
 
 # ==========================================================================
@@ -40,6 +51,7 @@ def create_engine() -> AsyncEngine:
     else:
         return create_async_engine(
             str(settings.DATABASE_URL),
+            poolclass=AsyncAdaptedQueuePool,  # QueuePool is not asyncio-safe
             pool_size=settings.DATABASE_POOL_SIZE,
             max_overflow=settings.DATABASE_MAX_OVERFLOW,
             echo=settings.DATABASE_ECHO,
@@ -107,6 +119,24 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# ==========================================================================
+# Query Helpers
+# ==========================================================================
+
+def strict_load(*options: ORMOption) -> tuple[ORMOption, ...]:
+    """
+    Loader options that forbid implicit relationship loads.
+
+    Appends raiseload("*") after the given eager options, so any relationship
+    a read path touches without loading it up front raises instead of
+    silently issuing one query per row (N+1).
+
+    Usage:
+        select(PipelineRun).options(*strict_load(selectinload(PipelineRun.epoch)))
+    """
+    return (*options, raiseload("*"))
+
+
 # ==========================================================================
 # Lifecycle
 # ==========================================================================
@@ -8,22 +8,38 @@ without explicit approval.
 """
 
 import enum
+import os
+import time
+import uuid
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import (
+    DDL,
     JSON,
     Boolean,
+    CheckConstraint,
+    ColumnElement,
+    Computed,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    SmallInteger,
     String,
     Text,
+    TypeDecorator,
+    case,
+    cast,
+    column,
+    event,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -169,6 +185,165 @@ class CCSessionPlatform(str, enum.Enum):
     WSL = "wsl"          # WSL with tmux
 
 
+# ==========================================================================
+# Column Types
+# ==========================================================================
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit Unix millisecond timestamp followed by 74 random bits. Keys
+    minted later sort later, so inserts on append-heavy tables land on the
+    rightmost btree leaf instead of a random page.
+
+    The same columns also carry a gen_random_uuid() server default, so bulk
+    SQL inserts that omit the id still get one.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                      # version
+        | (rand >> 62 & 0xFFF) << 64     # rand_a
+        | 0b10 << 62                     # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF   # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def varchar_enum(enum_class: type[enum.Enum]) -> Enum:
+    """
+    Enum column stored as VARCHAR(32) + CHECK instead of a PostgreSQL ENUM.
+
+    Adding or renaming a member is then a constraint swap rather than an
+    ALTER TYPE, and status/stage columns can carry plain partial btrees.
+    Values (not member names) are persisted, matching the migrations.
+
+    The type is left unnamed so its CHECK takes the per-column
+    ck_<table>_<column> name from the metadata naming convention instead
+    of the enum class name shared by every column of that type.
+    """
+    return Enum(
+        enum_class,
+        name=None,
+        native_enum=False,
+        length=32,
+        validate_strings=True,
+        create_constraint=True,
+        values_callable=lambda members: [m.value for m in members],
+    )
+
+
+class ScaledScore(TypeDecorator):
+    """
+    0-100.00 score stored as SMALLINT hundredths.
+
+    Two fixed bytes instead of a variable-width NUMERIC(5,2). Python still
+    reads and writes Decimal with two places, and literals compared against
+    the column bind through the same scaling, so btree lookups keep working.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * 100).to_integral_value(ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+def score_range(table: str, column: str) -> CheckConstraint:
+    """
+    Column-level CHECK keeping a ScaledScore within 0-100.00.
+
+    Named explicitly: a text-only CHECK has no bound column for the
+    naming convention to read, and ck_<table>_<column> is what
+    migration 007 creates.
+    """
+    return CheckConstraint(
+        f"{column} BETWEEN 0 AND 10000",
+        name=f"ck_{table}_{column}",
+    )
+
+
+def json_key(blob: str, key: str) -> ColumnElement:
+    """
+    One key of a JSON column as an expression for a Computed() column.
+
+    Renders per dialect (->> on PostgreSQL, JSON_EXTRACT on SQLite), so a
+    promoted key stays a STORED generated column derived from the blob
+    rather than a second copy the application has to write.
+    """
+    return column(blob, JSON)[key]
+
+
+# Values the guarded extractors below accept; anything else yields NULL.
+# No backslashes: PostgreSQL literal rendering would double them.
+_JSON_INT_PATTERN = "^-?[0-9]{1,9}$"  # fits INTEGER
+_JSON_SCORE_PATTERN = "^[0-9]{1,3}([.][0-9]+)?([eE]-[0-9]+)?$"  # 0-999.x
+
+
+def json_int(blob: str, key: str) -> ColumnElement:
+    """
+    Integer JSON key for a Computed() column, NULL unless it is a plain
+    integer (3.0, "n/a", ...), so a malformed blob can't abort the write.
+    """
+    value = cast(json_key(blob, key).as_string(), Text)
+    return case((value.regexp_match(_JSON_INT_PATTERN), cast(value, Integer)))
+
+
+def json_score(blob: str, key: str) -> ColumnElement:
+    """
+    0-100 JSON key for a ScaledScore Computed() column (hundredths), NULL
+    when it isn't a number in range, so score_range() can't abort the write.
+    """
+    value = cast(json_key(blob, key).as_string(), Text)
+    number = cast(value, Float)
+    # Nested CASEs: PostgreSQL doesn't promise to evaluate AND left to right
+    return case((
+        value.regexp_match(_JSON_SCORE_PATTERN),
+        case((number <= 100, cast(func.round(number * 100), SmallInteger))),
+    ))
+
+
+def brin_index(table: str, column: str) -> Index:
+    """
+    BRIN index for an append-ordered timestamp column.
+
+    Rows arrive in time order, so block-range min/max summaries prune
+    range scans nearly as well as a btree at a tiny fraction of the size
+    and insert cost. Other dialects get a plain index.
+    """
+    return Index(
+        f"ix_{table}_{column}_brin",
+        column,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+# ==========================================================================
+# Repr Helpers
+# ==========================================================================
+
+def loaded_attr(obj: object, key: str) -> object:
+    """
+    Attribute value for __repr__ without going through the ORM.
+
+    Reads the instance __dict__ directly, so an expired or deferred column
+    renders as "?" instead of emitting a lazy load (which under AsyncSession
+    raises MissingGreenlet). Enums render as their value.
+    """
+    value = obj.__dict__.get(key, "?")
+    return value.value if isinstance(value, enum.Enum) else value
+
+
 # ==========================================================================
 # Mixins
 # ==========================================================================
@@ -974,7 +1149,7 @@ class Epoch(Base, TimestampMixin):
         nullable=False,
     )  # List of enabled features
     status: Mapped[EpochStatus] = mapped_column(
-        Enum(EpochStatus),
+        varchar_enum(EpochStatus),
         default=EpochStatus.ACTIVE,
         nullable=False,
     )
@@ -989,13 +1164,15 @@ class Epoch(Base, TimestampMixin):
     )
 
     # Relationships
+    # Not loaded implicitly: an epoch can own thousands of runs. Callers that
+    # need them must ask with selectinload(Epoch.pipeline_runs).
     pipeline_runs: Mapped[list["PipelineRun"]] = relationship(
         back_populates="epoch",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
-        return f"<Epoch {self.name} v{self.version}>"
+        return f"<Epoch {loaded_attr(self, 'name')} v{loaded_attr(self, 'version')}>"
 
 
 class PipelineRun(Base, TimestampMixin):
@@ -1007,11 +1184,21 @@ class PipelineRun(Base, TimestampMixin):
     """
 
     __tablename__ = "pipeline_runs"
+    __table_args__ = (
+        # Almost every stage lookup (e.g. the PO review queue) is for running runs
+        Index(
+            "ix_pipeline_runs_running_stage",
+            "current_stage",
+            postgresql_where=text("status = 'running'"),
+        ),
+        brin_index("pipeline_runs", "created_at"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
     task_id: Mapped[str] = mapped_column(
         String(100),
@@ -1038,13 +1225,13 @@ class PipelineRun(Base, TimestampMixin):
 
     # Pipeline state
     current_stage: Mapped[PipelineStage] = mapped_column(
-        Enum(PipelineStage),
+        varchar_enum(PipelineStage),
         default=PipelineStage.QUEUED,
         nullable=False,
         index=True,
     )
     status: Mapped[PipelineRunStatus] = mapped_column(
-        Enum(PipelineRunStatus),
+        varchar_enum(PipelineRunStatus),
         default=PipelineRunStatus.RUNNING,
         nullable=False,
         index=True,
@@ -1057,7 +1244,7 @@ class PipelineRun(Base, TimestampMixin):
 
     # Execution
     escalation_level: Mapped[EscalationLevel] = mapped_column(
-        Enum(EscalationLevel),
+        varchar_enum(EscalationLevel),
         default=EscalationLevel.CODEX,
         nullable=False,
     )
@@ -1084,7 +1271,8 @@ class PipelineRun(Base, TimestampMixin):
 
     # Results
     final_trust_score: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("pipeline_runs", "final_trust_score"),
         nullable=True,
     )  # 0-100
     error_message: Mapped[Optional[str]] = mapped_column(
@@ -1094,29 +1282,33 @@ class PipelineRun(Base, TimestampMixin):
     run_metadata: Mapped[Optional[dict]] = mapped_column(
         JSON,
         nullable=True,
+        deferred=True,
+        deferred_group="bulk",
     )
 
     # Relationships
     epoch: Mapped[Optional["Epoch"]] = relationship(
         back_populates="pipeline_runs",
     )
+    # Collections are loaded per query (see pipeline.PIPELINE_RUN_FULL_LOAD) so
+    # that list/status views cost a single SELECT.
     stage_executions: Mapped[list["StageExecution"]] = relationship(
         back_populates="pipeline_run",
-        lazy="selectin",
         order_by="StageExecution.created_at",
     )
     handoff_tokens: Mapped[list["HandoffToken"]] = relationship(
         back_populates="pipeline_run",
-        lazy="selectin",
         order_by="HandoffToken.created_at",
     )
     resource_allocations: Mapped[list["ResourceAllocation"]] = relationship(
         back_populates="pipeline_run",
-        lazy="selectin",
     )
 
     def __repr__(self) -> str:
-        return f"<PipelineRun {self.task_id} [{self.current_stage.value}]>"
+        return (
+            f"<PipelineRun {loaded_attr(self, 'task_id')} "
+            f"[{loaded_attr(self, 'current_stage')}]>"
+        )
 
 
 class StageExecution(Base, TimestampMixin):
@@ -1127,11 +1319,15 @@ class StageExecution(Base, TimestampMixin):
     """
 
     __tablename__ = "stage_executions"
+    __table_args__ = (brin_index("stage_executions", "created_at"),)
+    # Fetch the generated metric columns back via RETURNING on every flush
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
     pipeline_run_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -1140,7 +1336,7 @@ class StageExecution(Base, TimestampMixin):
         index=True,
     )
     stage: Mapped[PipelineStage] = mapped_column(
-        Enum(PipelineStage),
+        varchar_enum(PipelineStage),
         nullable=False,
     )
     status: Mapped[str] = mapped_column(
@@ -1163,15 +1359,40 @@ class StageExecution(Base, TimestampMixin):
         nullable=True,
     )
 
-    # Results
+    # Results (deferred - list queries use the promoted columns below;
+    # load with undefer_group("bulk") when the full output is needed)
     output: Mapped[Optional[dict]] = mapped_column(
         JSON,
         nullable=True,
+        deferred=True,
+        deferred_group="bulk",
     )  # {tests_passed, lint_errors, health_score, etc.}
     error_message: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="bulk",
+    )
+
+    # Promoted output metrics: STORED generated columns over `output`, so
+    # hot keys are queryable without JSON parsing and never written twice
+    tests_passed: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed(json_int("output", "tests_passed"), persisted=True),
+        nullable=True,
     )
+    lint_errors: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed(json_int("output", "lint_errors"), persisted=True),
+        nullable=True,
+    )
+    health_score: Mapped[Optional[Decimal]] = mapped_column(
+        ScaledScore(),
+        Computed(json_score("output", "health_score"), persisted=True),
+        score_range("stage_executions", "health_score"),
+        nullable=True,
+        index=True,
+    )  # 0-100
 
     # Agent info
     agent_used: Mapped[Optional[str]] = mapped_column(
@@ -1200,7 +1421,7 @@ class StageExecution(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<StageExecution {self.stage.value} [{self.status}]>"
+        return f"<StageExecution {loaded_attr(self, 'stage')} [{loaded_attr(self, 'status')}]>"
 
 
 class HandoffToken(Base, TimestampMixin):
@@ -1217,7 +1438,8 @@ class HandoffToken(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
     pipeline_run_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -1228,44 +1450,53 @@ class HandoffToken(Base, TimestampMixin):
 
     # Transition
     from_stage: Mapped[PipelineStage] = mapped_column(
-        Enum(PipelineStage),
+        varchar_enum(PipelineStage),
         nullable=False,
     )
     to_stage: Mapped[PipelineStage] = mapped_column(
-        Enum(PipelineStage),
+        varchar_enum(PipelineStage),
         nullable=False,
     )
 
     # Trust scoring
     trust_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("handoff_tokens", "trust_score"),
         nullable=False,
+        index=True,
     )  # 0-100, must be >= 70 to pass
 
-    # Verification results
+    # Verification results (kept verbatim - the signature is computed over it).
+    # Read the flat *_score columns below instead of re-parsing this blob.
     verification: Mapped[dict] = mapped_column(
         JSON,
         nullable=False,
+        deferred=True,
+        deferred_group="bulk",
     )  # {tests: {passed, failed, skipped}, lint: {errors, warnings}, health: {score, checks}}
 
     # Score breakdown
     tests_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("handoff_tokens", "tests_score"),
         default=Decimal("0"),
         nullable=False,
     )  # Max 40 points
     lint_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("handoff_tokens", "lint_score"),
         default=Decimal("0"),
         nullable=False,
     )  # Max 20 points
     health_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("handoff_tokens", "health_score"),
         default=Decimal("0"),
         nullable=False,
     )  # Max 30 points
     console_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("handoff_tokens", "console_score"),
         default=Decimal("0"),
         nullable=False,
     )  # Max 10 points
@@ -1293,7 +1524,10 @@ class HandoffToken(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<HandoffToken {self.from_stage.value}→{self.to_stage.value} score={self.trust_score}>"
+        return (
+            f"<HandoffToken {loaded_attr(self, 'from_stage')}→{loaded_attr(self, 'to_stage')} "
+            f"score={loaded_attr(self, 'trust_score')}>"
+        )
 
 
 class GuardrailViolation(Base, TimestampMixin):
@@ -1305,16 +1539,18 @@ class GuardrailViolation(Base, TimestampMixin):
     """
 
     __tablename__ = "guardrail_violations"
+    __table_args__ = (brin_index("guardrail_violations", "created_at"),)
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
 
     # Violation details
     layer: Mapped[GuardrailLayer] = mapped_column(
-        Enum(GuardrailLayer),
+        varchar_enum(GuardrailLayer),
         nullable=False,
         index=True,
     )
@@ -1354,8 +1590,12 @@ class GuardrailViolation(Base, TimestampMixin):
     )  # Additional context data
 
     def __repr__(self) -> str:
-        status = "BLOCKED" if self.blocked else "ALLOWED"
-        return f"<GuardrailViolation [{status}] {self.layer.value}:{self.rule_name}>"
+        blocked = self.__dict__.get("blocked")
+        status = "?" if blocked is None else "BLOCKED" if blocked else "ALLOWED"
+        return (
+            f"<GuardrailViolation [{status}] "
+            f"{loaded_attr(self, 'layer')}:{loaded_attr(self, 'rule_name')}>"
+        )
 
 
 class ResourceAllocation(Base, TimestampMixin):
@@ -1371,7 +1611,8 @@ class ResourceAllocation(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
     pipeline_run_id: Mapped[Optional[UUID]] = mapped_column(
         UUID(as_uuid=True),
@@ -1387,7 +1628,7 @@ class ResourceAllocation(Base, TimestampMixin):
 
     # Resource details
     resource_type: Mapped[ResourceType] = mapped_column(
-        Enum(ResourceType),
+        varchar_enum(ResourceType),
         nullable=False,
     )
     value: Mapped[int] = mapped_column(
@@ -1419,8 +1660,12 @@ class ResourceAllocation(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        status = "active" if self.is_active else "released"
-        return f"<ResourceAllocation {self.resource_type.value}={self.value} [{status}]>"
+        is_active = self.__dict__.get("is_active")
+        status = "?" if is_active is None else "active" if is_active else "released"
+        return (
+            f"<ResourceAllocation {loaded_attr(self, 'resource_type')}="
+            f"{loaded_attr(self, 'value')} [{status}]>"
+        )
 
 
 class POReviewRequest(Base, TimestampMixin):
@@ -1436,7 +1681,8 @@ class POReviewRequest(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
     pipeline_run_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -1455,7 +1701,8 @@ class POReviewRequest(Base, TimestampMixin):
 
     # Metrics for review
     health_score: Mapped[Decimal] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("po_review_requests", "health_score"),
         nullable=False,
     )
     tests_passed: Mapped[int] = mapped_column(
@@ -1474,7 +1721,8 @@ class POReviewRequest(Base, TimestampMixin):
         nullable=False,
     )
     coverage_percent: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),
+        ScaledScore(),
+        score_range("po_review_requests", "coverage_percent"),
         nullable=True,
     )
 
@@ -1511,7 +1759,10 @@ class POReviewRequest(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<POReviewRequest {self.pipeline_run_id} [{self.status}]>"
+        return (
+            f"<POReviewRequest {loaded_attr(self, 'pipeline_run_id')} "
+            f"[{loaded_attr(self, 'status')}]>"
+        )
 
 
 # ==========================================================================
@@ -1528,11 +1779,13 @@ class CCSession(Base, TimestampMixin):
     """
 
     __tablename__ = "cc_sessions"
+    __table_args__ = (brin_index("cc_sessions", "created_at"),)
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        server_default=func.gen_random_uuid(),
     )
 
     # Session identification
@@ -1545,7 +1798,7 @@ class CCSession(Base, TimestampMixin):
 
     # Platform & Process
     platform: Mapped[CCSessionPlatform] = mapped_column(
-        Enum(CCSessionPlatform),
+        varchar_enum(CCSessionPlatform),
         nullable=False,
     )
     process_handle: Mapped[Optional[str]] = mapped_column(
@@ -1559,7 +1812,7 @@ class CCSession(Base, TimestampMixin):
 
     # Status tracking
     status: Mapped[CCSessionStatus] = mapped_column(
-        Enum(CCSessionStatus),
+        varchar_enum(CCSessionStatus),
         default=CCSessionStatus.IDLE,
         nullable=False,
         index=True,
@@ -1579,6 +1832,8 @@ class CCSession(Base, TimestampMixin):
     task_prompt: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="bulk",
     )  # Current task prompt
 
     # Timing
@@ -1659,6 +1914,8 @@ class CCSession(Base, TimestampMixin):
     context_snapshot: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="bulk",
     )  # Last N lines of output for restart context
 
     # Relationships
@@ -1671,7 +1928,7 @@ class CCSession(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        return f"<CCSession {self.session_name} [{self.status.value}]>"
+        return f"<CCSession {loaded_attr(self, 'session_name')} [{loaded_attr(self, 'status')}]>"
 
 
 class CCSessionOutput(Base):
@@ -1680,24 +1937,27 @@ class CCSessionOutput(Base):
 
     Stores output lines for streaming and analysis.
     Uses a separate table for efficient appends and queries.
+    On PostgreSQL the table is hash-partitioned by session_id
+    (CC_SESSION_OUTPUT_PARTITIONS partitions) and keyed by
+    (session_id, line_number), so tailing a session is an index range scan.
     """
 
     __tablename__ = "cc_session_outputs"
-
-    id: Mapped[int] = mapped_column(
-        Integer,
-        primary_key=True,
-        autoincrement=True,
+    __table_args__ = (
+        brin_index("cc_session_outputs", "timestamp"),
+        {"postgresql_partition_by": "HASH (session_id)"},
     )
+
+    # No separate index on session_id: it is the leading PK column.
     session_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("cc_sessions.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     line_number: Mapped[int] = mapped_column(
         Integer,
-        nullable=False,
+        primary_key=True,
+        autoincrement=False,
     )
     content: Mapped[str] = mapped_column(
         Text,
@@ -1722,5 +1982,36 @@ class CCSessionOutput(Base):
     )
 
     def __repr__(self) -> str:
-        preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
-        return f"<CCSessionOutput L{self.line_number}: {preview}>"
+        content = self.__dict__.get("content", "?")
+        preview = content[:50] + "..." if len(content) > 50 else content
+        return f"<CCSessionOutput L{loaded_attr(self, 'line_number')}: {preview}>"
+
+
+# Hash partitions for cc_session_outputs (PostgreSQL only)
+CC_SESSION_OUTPUT_PARTITIONS = 16
+
+# Output lines are mostly well under the default ~2 kB TOAST threshold, so
+# partitions lower toast_tuple_target to let PostgreSQL compress them at all
+CC_SESSION_OUTPUT_TOAST_TARGET = 128
+
+for _remainder in range(CC_SESSION_OUTPUT_PARTITIONS):
+    event.listen(
+        CCSessionOutput.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS cc_session_outputs_p{_remainder} "
+            f"PARTITION OF cc_session_outputs "
+            f"FOR VALUES WITH (MODULUS {CC_SESSION_OUTPUT_PARTITIONS}, REMAINDER {_remainder}) "
+            f"WITH (toast_tuple_target = {CC_SESSION_OUTPUT_TOAST_TARGET})"
+        ).execute_if(dialect="postgresql"),
+    )
+
+# LZ4 rather than the default pglz for content (PostgreSQL 14+); recurses
+# into the partitions created above
+event.listen(
+    CCSessionOutput.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE cc_session_outputs ALTER COLUMN content SET COMPRESSION lz4"
+    ).execute_if(dialect="postgresql"),
+)
@@ -51,9 +51,7 @@ from .asset_registry import (
     AssetType,
     AssetStatus,
     ProjectStatus as AssetProjectStatus,
-    ProjectPriority,
     AIToolCapability,
-    TaskComplexity,
     Asset,
     HardwareAsset,
     ServiceAsset,
@@ -64,6 +62,7 @@ from .asset_registry import (
     DelegationRule,
     DelegationMatrix,
 )
+from .enums import ProjectPriority, TaskComplexity
 from .syncwave_client import (
     SyncWaveClient,
     NotificationPriority,
@@ -78,7 +77,6 @@ from .dispatcher import (
     CCDispatcher,
     RoutingEngine,
     DispatchTask,
-    ProjectPriority,
     AITool,
     RoutingRule,
 )
@@ -158,7 +156,6 @@ __all__ = [
     "CCDispatcher",
     "RoutingEngine",
     "DispatchTask",
-    "ProjectPriority",
     "AITool",
     "RoutingRule",
     # System Status
@@ -7,15 +7,30 @@ and executes transformations with real-time progress tracking.
 """
 
 import os
-import json
 import asyncio
+import contextlib
+import functools
+import time
+from collections import Counter, deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable, AsyncGenerator
+from typing import Optional, List, Dict, Any, Callable, AsyncGenerator, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from uuid import uuid4
 import re
+import mmap
+import string
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+from .ids import next_id
+from .slots import watch_slot
+
+# orjson is optional; stdlib json.loads accepts the same bytes input
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # ==========================================================================
 # Enums & Types
@@ -47,12 +62,137 @@ class LogLevel(str, Enum):
     SUCCESS = "success"
 
 
+# ==========================================================================
+# Patterns
+# ==========================================================================
+
+# FastAPI route decorators, e.g. ``@router.get("/items")``. Bytes pattern so
+# it can run directly over an mmap without decoding the file. The shared
+# literal prefix lets sre skip ahead to each "@router." before trying the
+# verbs, so this is one forward pass per file.
+_ROUTE_DECORATOR_RE = re.compile(rb'@router\.(?:get|post|put|patch|delete)')
+
+# Known package.json libraries and the TechStack list each is reported in,
+# in reporting order
+_LIB_BUCKETS: Tuple[Tuple[str, str], ...] = (
+    ('react-big-calendar', 'ui_libraries'),
+    ('react-beautiful-dnd', 'ui_libraries'),
+    ('@mui/material', 'ui_libraries'),
+    ('tailwindcss', 'ui_libraries'),
+    ('antd', 'ui_libraries'),
+    ('zustand', 'state_management'),
+    ('redux', 'state_management'),
+    ('recoil', 'state_management'),
+    ('jotai', 'state_management'),
+    ('mobx', 'state_management'),
+    ('jest', 'testing'),
+    ('vitest', 'testing'),
+    ('cypress', 'testing'),
+    ('playwright', 'testing'),
+    ('@testing-library/react', 'testing'),
+)
+
+# requirements.txt markers for _detect_tech_stack, matched in one pass over
+# the ASCII-lowercased bytes (none of them overlaps another)
+_REQ_NEEDLES_RE = re.compile(
+    rb'fastapi|django|flask|sqlalchemy|google-generativeai|gemini|openai|anthropic'
+)
+_LOWER_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode(), string.ascii_lowercase.encode()
+)
+
+# Log entries kept per analyzer/engine; older ones drop off (the callback
+# remains the full live stream)
+MAX_LOG_ENTRIES = 10_000
+
+@functools.lru_cache(maxsize=2)
+def _iso_second(s: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(s))
+
+
+def _utcnow_iso() -> str:
+    """
+    Same string as datetime.utcnow().isoformat(), without building a datetime.
+
+    The seconds prefix is formatted once per second; log bursts within the
+    same second only format the microseconds.
+    """
+    s, ns = divmod(time.time_ns(), 1_000_000_000)
+    us = ns // 1000
+    return f"{_iso_second(s)}.{us:06d}" if us else _iso_second(s)
+
+
+# Minimum gap between progress callbacks (~30 updates/s); callers usually
+# serialize the whole plan, so per-step emits are coalesced to this rate
+PROGRESS_EMIT_INTERVAL = 0.033
+
+# Code files above this size (typically bundled/minified output) get an
+# estimated line count instead of being read; the scores only care about
+# order of magnitude
+LARGE_FILE_THRESHOLD = 2 * 1024 * 1024
+APPROX_BYTES_PER_LINE = 40
+
+# Read size when counting newlines
+_COUNT_CHUNK = 1 << 20
+
+# Line-counting threads; reads release the GIL, so oversubscribe the cores
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _count_lines(path) -> int:
+    """Count lines by counting newline bytes over raw binary chunks (no decode)."""
+    lines = 0
+    last = 0x0A
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while chunk := f.read(_COUNT_CHUNK):
+            lines += chunk.count(b'\n')
+            last = chunk[-1]
+    # A final line without a trailing newline still counts
+    return lines if last == 0x0A else lines + 1
+
+
+def _is_large(size: Optional[int]) -> bool:
+    return size is not None and size > LARGE_FILE_THRESHOLD
+
+
+def _count_routes(path) -> int:
+    """Count route decorators in a Python file by scanning its mapped bytes."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return len(_ROUTE_DECORATOR_RE.findall(mm))
+
+
+# Manifests are re-read on every analysis; keyed on (mtime_ns, size) so an
+# edited file misses the cache. Callers must treat results as read-only.
+@functools.lru_cache(maxsize=64)
+def _load_package_deps(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """dependencies + devDependencies from a package.json; nothing else is kept."""
+    with open(path, 'rb') as f:
+        pkg = _json.loads(f.read())
+    return {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_requirements(path: str, mtime_ns: int, size: int) -> frozenset:
+    """Set of _REQ_NEEDLES_RE needles found anywhere in the file (case-insensitive)."""
+    with open(path, 'rb') as f:
+        raw = f.read().translate(_LOWER_TABLE)
+    return frozenset(m.decode() for m in _REQ_NEEDLES_RE.findall(raw))
+
+
 # ==========================================================================
 # Data Classes
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectFile:
+    # One per scanned file and never modified after the scan. The per-file
+    # collections default to the shared empty tuple rather than three fresh
+    # lists per record.
     path: str
     name: str
     extension: str
@@ -60,13 +200,13 @@ class ProjectFile:
     lines: int = 0
     file_type: str = "other"
     language: str = "other"
-    imports: List[str] = field(default_factory=list)
-    exports: List[str] = field(default_factory=list)
+    imports: Tuple[str, ...] = ()
+    exports: Tuple[str, ...] = ()
     complexity: int = 0
-    issues: List[str] = field(default_factory=list)
+    issues: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class TechStack:
     frontend_framework: str = ""
     frontend_version: str = ""
@@ -82,7 +222,7 @@ class TechStack:
     testing: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     project_path: str
     project_name: str
@@ -101,8 +241,15 @@ class AnalysisResult:
     recommendations: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
-class ExecutionTask:
+class _TaskSlots:
+    # Non-field slot: the phase whose tallies the task's status feeds.
+    # Declared on a base so it stays out of fields()/asdict()/repr().
+    __slots__ = ("_phase",)
+    _phase: Optional["ExecutionPhase"]
+
+
+@dataclass(slots=True)
+class ExecutionTask(_TaskSlots):
     id: str
     name: str
     description: str
@@ -124,13 +271,34 @@ class ExecutionTask:
     execute_fn: Optional[Callable] = None
 
 
-@dataclass
-class ExecutionPhase:
+def _on_task_status(task: ExecutionTask, old: Optional[PhaseStatus], new: PhaseStatus) -> PhaseStatus:
+    phase = getattr(task, "_phase", None)
+    if phase is not None and old != new:
+        phase._tally(old, -1)
+        phase._tally(new, 1)
+    return new
+
+
+watch_slot(ExecutionTask, "status", _on_task_status)
+
+
+class _PhaseSlots:
+    # Non-field slots for the completed/failed tallies (see _TaskSlots)
+    __slots__ = ("_completed", "_failed")
+    _completed: int
+    _failed: int
+
+
+@dataclass(slots=True)
+class ExecutionPhase(_PhaseSlots):
+    # tasks is stored as a tuple and status changes on its tasks update
+    # the tallies, so progress reads are O(1) instead of a rescan per emit.
+    # Reassign tasks (not mutate it) to add or remove any.
     id: str
     name: str
     description: str
     order: int
-    tasks: List[ExecutionTask] = field(default_factory=list)
+    tasks: Tuple[ExecutionTask, ...] = ()
     status: PhaseStatus = PhaseStatus.PENDING
     current_task_index: int = 0
     estimated_duration_minutes: float = 5
@@ -138,13 +306,23 @@ class ExecutionPhase:
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
     
+    def _tally(self, status: Optional[PhaseStatus], delta: int):
+        if status == PhaseStatus.COMPLETED:
+            self._completed += delta
+        elif status == PhaseStatus.FAILED:
+            self._failed += delta
+    
     @property
     def total_tasks(self) -> int:
         return len(self.tasks)
     
     @property
     def completed_tasks(self) -> int:
-        return sum(1 for t in self.tasks if t.status == PhaseStatus.COMPLETED)
+        return self._completed
+    
+    @property
+    def failed_tasks(self) -> int:
+        return self._failed
     
     @property
     def progress_percent(self) -> float:
@@ -153,7 +331,21 @@ class ExecutionPhase:
         return (self.completed_tasks / self.total_tasks) * 100
 
 
-@dataclass
+def _on_phase_tasks(phase: ExecutionPhase, old, new) -> Tuple[ExecutionTask, ...]:
+    new = tuple(new)
+    for task in old or ():
+        task._phase = None
+    phase._completed = phase._failed = 0
+    for task in new:
+        task._phase = phase
+        phase._tally(task.status, 1)
+    return new
+
+
+watch_slot(ExecutionPhase, "tasks", _on_phase_tasks)
+
+
+@dataclass(slots=True)
 class ExecutionPlan:
     id: str
     project_path: str
@@ -178,7 +370,7 @@ class ExecutionPlan:
     
     @property
     def failed_tasks(self) -> int:
-        return sum(1 for p in self.phases for t in p.tasks if t.status == PhaseStatus.FAILED)
+        return sum(p.failed_tasks for p in self.phases)
     
     @property
     def progress_percent(self) -> float:
@@ -187,7 +379,7 @@ class ExecutionPlan:
         return (self.completed_tasks / self.total_tasks) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     id: str
     timestamp: str
@@ -198,6 +390,66 @@ class LogEntry:
     details: Optional[Dict[str, Any]] = None
 
 
+# ==========================================================================
+# Recommendation Templates
+# ==========================================================================
+
+# Static content for ProjectAnalyzer._generate_recommendations; each
+# analysis copies these and adds an id.
+_ADHD_RECOMMENDATIONS: tuple = (
+    {
+        'category': 'adhd_ux',
+        'priority': 'high',
+        'title': 'Add Focus Mode',
+        'current_state': 'Multiple UI elements visible at once',
+        'recommended_state': 'Single-task focus mode with distractions hidden',
+        'rationale': 'Reduces cognitive load for ADHD users',
+        'effort_hours': 8,
+    },
+    {
+        'category': 'adhd_ux',
+        'priority': 'high',
+        'title': 'Visual Time Estimation',
+        'current_state': 'Text-based time estimates',
+        'recommended_state': 'Visual countdown timers with color-coded urgency',
+        'rationale': 'Compensates for time blindness common in ADHD',
+        'effort_hours': 6,
+    },
+)
+
+# Only when no state management library was detected
+_STATE_MANAGEMENT_RECOMMENDATION = {
+    'category': 'scalability',
+    'priority': 'critical',
+    'title': 'Add State Management',
+    'current_state': 'React Context only',
+    'recommended_state': 'Zustand + Immer for scalable state',
+    'rationale': 'Context re-renders entire tree, Zustand is more performant',
+    'effort_hours': 4,
+}
+
+_ARCHITECTURE_RECOMMENDATIONS: tuple = (
+    {
+        'category': 'scalability',
+        'priority': 'critical',
+        'title': 'Block-Based Architecture',
+        'current_state': 'Fixed Task model',
+        'recommended_state': 'Generic Block model (like Notion)',
+        'rationale': 'Enables infinite nesting and flexible content types',
+        'effort_hours': 20,
+    },
+    {
+        'category': 'performance',
+        'priority': 'high',
+        'title': 'Real-time Sync',
+        'current_state': 'REST API with polling',
+        'recommended_state': 'WebSocket + Event Sourcing',
+        'rationale': 'Enables instant updates and offline support',
+        'effort_hours': 16,
+    },
+)
+
+
 # ==========================================================================
 # Project Analyzer Engine
 # ==========================================================================
@@ -207,16 +459,16 @@ class ProjectAnalyzer:
     Analyzes project structure and generates refactoring plans.
     """
     
-    IGNORE_DIRS = {
+    IGNORE_DIRS = frozenset({
         'node_modules', '.git', '__pycache__', '.venv', 'venv',
         'dist', 'build', '.next', '.cache', 'coverage', '.pytest_cache'
-    }
+    })
     
-    IGNORE_FILES = {
+    IGNORE_FILES = frozenset({
         '.DS_Store', 'Thumbs.db', '.gitignore', '.env', '.env.local'
-    }
+    })
     
-    CODE_EXTENSIONS = {
+    CODE_EXTENSIONS = MappingProxyType({
         '.py': 'python',
         '.ts': 'typescript',
         '.tsx': 'typescript',
@@ -229,27 +481,39 @@ class ProjectAnalyzer:
         '.yml': 'yaml',
         '.md': 'markdown',
         '.html': 'html',
-    }
+    })
+    
+    # Plain set for the per-file "is this code?" test
+    _CODE_EXT_SET = frozenset(CODE_EXTENSIONS)
     
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
+        # Plain-string form for the per-file hot paths (no PurePath churn)
+        self._project_path_str = str(self.project_path)
         self.result = AnalysisResult(
             project_path=str(self.project_path),
             project_name=self.project_path.name,
-            analyzed_at=datetime.utcnow().isoformat()
+            analyzed_at=_utcnow_iso()
         )
-        self.logs: List[LogEntry] = []
+        self.logs: deque[LogEntry] = deque(maxlen=MAX_LOG_ENTRIES)
         self._log_callback: Optional[Callable[[LogEntry], None]] = None
+        # Per-file tallies filled in by _scan_files, so scoring needn't rescan
+        self._type_counts: Counter = Counter()
+        self._language_counts: Counter = Counter()
     
     def set_log_callback(self, callback: Callable[[LogEntry], None]):
         """Set callback for real-time log streaming."""
         self._log_callback = callback
     
+    def snapshot_logs(self) -> List[LogEntry]:
+        """Copy of the retained log entries, oldest first."""
+        return list(self.logs)
+    
     def _log(self, level: LogLevel, message: str, phase_id: str = None, task_id: str = None, **details):
         """Create and emit log entry."""
         entry = LogEntry(
-            id=str(uuid4()),
-            timestamp=datetime.utcnow().isoformat(),
+            id=next_id(),
+            timestamp=_utcnow_iso(),
             level=level,
             message=message,
             phase_id=phase_id,
@@ -288,57 +552,109 @@ class ProjectAnalyzer:
         """Scan all files in project."""
         self._log(LogLevel.INFO, "Scanning file structure...")
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Filter ignored directories
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS]
-            
-            rel_root = Path(root).relative_to(self.project_path)
-            
-            for filename in files:
-                if filename in self.IGNORE_FILES:
-                    continue
+        candidates = await asyncio.to_thread(self._collect_files)
+        line_counts = await asyncio.to_thread(self._count_code_lines, candidates)
+        
+        for (abs_path, rel_path, filename, ext, size), lines in zip(candidates, line_counts, strict=True):
+            try:
+                if size is None:
+                    size = os.stat(abs_path).st_size
+                elif _is_large(size) and ext in self._CODE_EXT_SET:
+                    self._log(
+                        LogLevel.INFO,
+                        f"Approximated line count for {rel_path} ({size} bytes)",
+                        approximate_lines=True,
+                    )
                 
-                filepath = Path(root) / filename
-                rel_path = str(rel_root / filename)
-                ext = filepath.suffix.lower()
+                file_type = self._detect_file_type(rel_path, ext)
                 
-                try:
-                    stat = filepath.stat()
-                    lines = 0
-                    
-                    if ext in self.CODE_EXTENSIONS:
-                        try:
-                            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                                lines = sum(1 for _ in f)
-                        except:
-                            pass
-                    
-                    file_type = self._detect_file_type(rel_path, ext)
-                    
-                    pf = ProjectFile(
-                        path=rel_path,
-                        name=filename,
-                        extension=ext,
-                        size=stat.st_size,
-                        lines=lines,
-                        file_type=file_type,
-                        language=self.CODE_EXTENSIONS.get(ext, 'other')
-                    )
-                    
-                    self.result.files.append(pf)
-                    self.result.total_files += 1
-                    self.result.total_lines += lines
-                    
-                    if file_type == 'component':
-                        self.result.total_components += 1
-                    elif file_type == 'hook':
-                        self.result.total_hooks += 1
-                    
-                except Exception as e:
-                    self._log(LogLevel.WARN, f"Error scanning {rel_path}: {e}")
+                pf = ProjectFile(
+                    path=rel_path,
+                    name=filename,
+                    extension=ext,
+                    size=size,
+                    lines=lines,
+                    file_type=file_type,
+                    language=self.CODE_EXTENSIONS.get(ext, 'other')
+                )
+                
+                self.result.files.append(pf)
+                self.result.total_files += 1
+                self.result.total_lines += lines
+                self._type_counts[file_type] += 1
+                self._language_counts[pf.language] += 1
+                
+                if file_type == 'component':
+                    self.result.total_components += 1
+                elif file_type == 'hook':
+                    self.result.total_hooks += 1
+                
+            except Exception as e:
+                self._log(LogLevel.WARN, f"Error scanning {rel_path}: {e}")
         
         self._log(LogLevel.SUCCESS, f"Scanned {self.result.total_files} files")
     
+    def _collect_files(self) -> List[tuple]:
+        """Walk the project and return (abs_path, rel_path, filename, ext, size) per file."""
+        return [
+            (abs_path, rel_path, name, os.path.splitext(name)[1].lower(), size)
+            for abs_path, rel_path, name, size in self._iter_entries(self._project_path_str, '')
+        ]
+    
+    def _iter_entries(self, path: str, rel_prefix: str):
+        """
+        Yield (abs_path, rel_path, filename, size) for every non-ignored file.
+        
+        scandir hands back d_type with each entry, so directories are told
+        apart without a stat; files get exactly one. Files in a directory are
+        yielded before its subdirectories, matching os.walk's order.
+        """
+        ignore_dirs = self.IGNORE_DIRS
+        ignore_files = self.IGNORE_FILES
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir():
+                        # Like os.walk(followlinks=False): skip symlinked dirs
+                        if name not in ignore_dirs and not entry.is_symlink():
+                            subdirs.append((entry.path, rel_prefix + name + os.sep))
+                        continue
+                    if name in ignore_files:
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = None  # re-stat'd in _scan_files so the error gets logged
+                    yield entry.path, rel_prefix + name, name, size
+        except OSError:
+            return  # unreadable directory, os.walk skips these too
+        
+        for sub_path, sub_prefix in subdirs:
+            yield from self._iter_entries(sub_path, sub_prefix)
+    
+    def _count_code_lines(self, candidates: List[tuple]) -> List[int]:
+        """Line-count every code file on a thread pool; 0 for everything else."""
+        code_ext = self._CODE_EXT_SET
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+            futures = [
+                ex.submit(_count_lines, abs_path)
+                if ext in code_ext and not _is_large(size) else None
+                for abs_path, _, _, ext, size in candidates
+            ]
+        
+        counts = []
+        for (_, _, _, ext, size), future in zip(candidates, futures, strict=True):
+            if future is None:
+                counts.append(size // APPROX_BYTES_PER_LINE if ext in code_ext else 0)
+                continue
+            try:
+                counts.append(future.result())
+            except Exception:
+                counts.append(0)  # unreadable file: keep it, just uncounted
+        return counts
+    
     def _detect_file_type(self, path: str, ext: str) -> str:
         """Detect file type based on path and extension."""
         path_lower = path.lower()
@@ -379,10 +695,8 @@ class ProjectAnalyzer:
         
         if pkg_json_path.exists():
             try:
-                with open(pkg_json_path) as f:
-                    pkg = json.load(f)
-                
-                deps = {**pkg.get('dependencies', {}), **pkg.get('devDependencies', {})}
+                st = pkg_json_path.stat()
+                deps = _load_package_deps(str(pkg_json_path), st.st_mtime_ns, st.st_size)
                 
                 # Frontend
                 if 'react' in deps:
@@ -392,13 +706,14 @@ class ProjectAnalyzer:
                     self.result.tech_stack.frontend_framework = 'Vue'
                     self.result.tech_stack.frontend_version = deps.get('vue', '')
                 
-                # UI Libraries
-                ui_libs = ['react-big-calendar', 'react-beautiful-dnd', '@mui/material', 'tailwindcss', 'antd']
-                self.result.tech_stack.ui_libraries = [lib for lib in ui_libs if lib in deps]
-                
-                # State Management
-                state_libs = ['zustand', 'redux', 'recoil', 'jotai', 'mobx']
-                self.result.tech_stack.state_management = [lib for lib in state_libs if lib in deps]
+                # UI libraries, state management and testing in one pass
+                found = {'ui_libraries': [], 'state_management': [], 'testing': []}
+                for lib, bucket in _LIB_BUCKETS:
+                    if lib in deps:
+                        found[bucket].append(lib)
+                self.result.tech_stack.ui_libraries = found['ui_libraries']
+                self.result.tech_stack.state_management = found['state_management']
+                self.result.tech_stack.testing = found['testing']
                 
                 # Build Tool
                 if 'vite' in deps:
@@ -408,10 +723,6 @@ class ProjectAnalyzer:
                 elif 'webpack' in deps:
                     self.result.tech_stack.build_tool = 'Webpack'
                 
-                # Testing
-                test_libs = ['jest', 'vitest', 'cypress', 'playwright', '@testing-library/react']
-                self.result.tech_stack.testing = [lib for lib in test_libs if lib in deps]
-                
                 self._log(LogLevel.SUCCESS, f"Frontend: {self.result.tech_stack.frontend_framework}")
                 
             except Exception as e:
@@ -424,8 +735,8 @@ class ProjectAnalyzer:
         
         if req_path.exists():
             try:
-                with open(req_path) as f:
-                    reqs = f.read().lower()
+                st = req_path.stat()
+                reqs = _parse_requirements(str(req_path), st.st_mtime_ns, st.st_size)
                 
                 if 'fastapi' in reqs:
                     self.result.tech_stack.backend_framework = 'FastAPI'
@@ -458,13 +769,10 @@ class ProjectAnalyzer:
         # Count API endpoints
         for pf in self.result.files:
             if pf.file_type == 'api' and pf.language == 'python':
-                filepath = self.project_path / pf.path
+                filepath = os.path.join(self._project_path_str, pf.path)
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
                     # Count route decorators
-                    routes = len(re.findall(r'@router\.(get|post|put|patch|delete)', content))
+                    routes = _count_routes(filepath)
                     self.result.total_api_endpoints += routes
                     
                 except:
@@ -487,8 +795,8 @@ class ProjectAnalyzer:
             self.result.complexity_score = 85
         
         # Maintainability based on structure
-        has_tests = any(f.file_type == 'test' for f in self.result.files)
-        has_types = self.result.tech_stack.frontend_framework and 'typescript' in [f.language for f in self.result.files]
+        has_tests = self._type_counts['test'] > 0
+        has_types = self.result.tech_stack.frontend_framework and self._language_counts['typescript'] > 0
         
         self.result.maintainability_score = 50
         if has_tests:
@@ -509,64 +817,13 @@ class ProjectAnalyzer:
     
     def _generate_recommendations(self):
         """Generate improvement recommendations."""
-        
-        # ADHD-specific recommendations
-        self.result.recommendations.append({
-            'id': str(uuid4()),
-            'category': 'adhd_ux',
-            'priority': 'high',
-            'title': 'Add Focus Mode',
-            'current_state': 'Multiple UI elements visible at once',
-            'recommended_state': 'Single-task focus mode with distractions hidden',
-            'rationale': 'Reduces cognitive load for ADHD users',
-            'effort_hours': 8,
-        })
-        
-        self.result.recommendations.append({
-            'id': str(uuid4()),
-            'category': 'adhd_ux',
-            'priority': 'high',
-            'title': 'Visual Time Estimation',
-            'current_state': 'Text-based time estimates',
-            'recommended_state': 'Visual countdown timers with color-coded urgency',
-            'rationale': 'Compensates for time blindness common in ADHD',
-            'effort_hours': 6,
-        })
-        
+        templates = _ADHD_RECOMMENDATIONS
         # Architecture recommendations
         if not self.result.tech_stack.state_management:
-            self.result.recommendations.append({
-                'id': str(uuid4()),
-                'category': 'scalability',
-                'priority': 'critical',
-                'title': 'Add State Management',
-                'current_state': 'React Context only',
-                'recommended_state': 'Zustand + Immer for scalable state',
-                'rationale': 'Context re-renders entire tree, Zustand is more performant',
-                'effort_hours': 4,
-            })
-        
-        self.result.recommendations.append({
-            'id': str(uuid4()),
-            'category': 'scalability',
-            'priority': 'critical',
-            'title': 'Block-Based Architecture',
-            'current_state': 'Fixed Task model',
-            'recommended_state': 'Generic Block model (like Notion)',
-            'rationale': 'Enables infinite nesting and flexible content types',
-            'effort_hours': 20,
-        })
-        
-        self.result.recommendations.append({
-            'id': str(uuid4()),
-            'category': 'performance',
-            'priority': 'high',
-            'title': 'Real-time Sync',
-            'current_state': 'REST API with polling',
-            'recommended_state': 'WebSocket + Event Sourcing',
-            'rationale': 'Enables instant updates and offline support',
-            'effort_hours': 16,
-        })
+            templates += (_STATE_MANAGEMENT_RECOMMENDATION,)
+        templates += _ARCHITECTURE_RECOMMENDATIONS
+        
+        self.result.recommendations.extend({'id': next_id(), **tpl} for tpl in templates)
         
         self._log(LogLevel.INFO, f"Generated {len(self.result.recommendations)} recommendations")
 
@@ -583,12 +840,18 @@ class ExecutionEngine:
     def __init__(self, plan: ExecutionPlan, project_path: str):
         self.plan = plan
         self.project_path = Path(project_path)
-        self.logs: List[LogEntry] = []
+        self.logs: deque[LogEntry] = deque(maxlen=MAX_LOG_ENTRIES)
         self._log_callback: Optional[Callable[[LogEntry], None]] = None
         self._progress_callback: Optional[Callable[[ExecutionPlan], None]] = None
         self._is_running = False
-        self._is_paused = False
-        self._should_cancel = False
+        # Set by cancel(); wakes any in-flight step wait immediately
+        self._cancel_event = asyncio.Event()
+        # Set while running, cleared while paused
+        self._run_event = asyncio.Event()
+        self._run_event.set()
+        # Progress coalescing, active while execute() runs
+        self._progress_dirty = asyncio.Event()
+        self._emit_loop_task: Optional[asyncio.Task] = None
     
     def set_callbacks(
         self,
@@ -599,11 +862,15 @@ class ExecutionEngine:
         self._log_callback = log_callback
         self._progress_callback = progress_callback
     
+    def snapshot_logs(self) -> List[LogEntry]:
+        """Copy of the retained log entries, oldest first."""
+        return list(self.logs)
+    
     def _log(self, level: LogLevel, message: str, phase_id: str = None, task_id: str = None):
         """Emit log entry."""
         entry = LogEntry(
-            id=str(uuid4()),
-            timestamp=datetime.utcnow().isoformat(),
+            id=next_id(),
+            timestamp=_utcnow_iso(),
             level=level,
             message=message,
             phase_id=phase_id,
@@ -614,25 +881,42 @@ class ExecutionEngine:
             self._log_callback(entry)
     
     def _emit_progress(self):
-        """Emit progress update."""
-        if self._progress_callback:
+        """Emit progress update (coalesced while the plan is executing)."""
+        if not self._progress_callback:
+            return
+        if self._emit_loop_task is not None:
+            self._progress_dirty.set()
+        else:
             self._progress_callback(self.plan)
     
+    async def _emit_loop(self):
+        """Deliver pending progress at most once per PROGRESS_EMIT_INTERVAL."""
+        while True:
+            await self._progress_dirty.wait()
+            self._progress_dirty.clear()
+            if self._progress_callback:
+                try:
+                    self._progress_callback(self.plan)
+                except Exception as e:
+                    self._log(LogLevel.WARN, f"Progress callback failed: {e}")
+            await asyncio.sleep(PROGRESS_EMIT_INTERVAL)
+    
     async def execute(self) -> ExecutionPlan:
         """Execute the plan."""
         self._is_running = True
-        self._should_cancel = False
+        self._cancel_event.clear()
         
         self.plan.status = PhaseStatus.RUNNING
-        self.plan.started_at = datetime.utcnow().isoformat()
+        self.plan.started_at = _utcnow_iso()
         self._log(LogLevel.INFO, f"Starting execution: {self.plan.name}")
+        self._emit_loop_task = asyncio.create_task(self._emit_loop())
         self._emit_progress()
         
         start_time = datetime.utcnow()
         
         try:
             for phase_idx, phase in enumerate(self.plan.phases):
-                if self._should_cancel:
+                if self._cancel_event.is_set():
                     break
                 
                 self.plan.current_phase_index = phase_idx
@@ -642,9 +926,9 @@ class ExecutionEngine:
                     self.plan.status = PhaseStatus.FAILED
                     break
             
-            if not self._should_cancel and self.plan.status != PhaseStatus.FAILED:
+            if not self._cancel_event.is_set() and self.plan.status != PhaseStatus.FAILED:
                 self.plan.status = PhaseStatus.COMPLETED
-                self.plan.completed_at = datetime.utcnow().isoformat()
+                self.plan.completed_at = _utcnow_iso()
                 
         except Exception as e:
             self._log(LogLevel.ERROR, f"Execution failed: {e}")
@@ -654,25 +938,30 @@ class ExecutionEngine:
             self._is_running = False
             duration = (datetime.utcnow() - start_time).total_seconds() / 60
             self.plan.actual_duration_minutes = duration
-            self._emit_progress()
+            
+            self._emit_loop_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._emit_loop_task
+            self._emit_loop_task = None
+            self._progress_dirty.clear()
+            self._emit_progress()  # final state, delivered directly
         
         return self.plan
     
     async def _execute_phase(self, phase: ExecutionPhase):
         """Execute a single phase."""
         phase.status = PhaseStatus.RUNNING
-        phase.started_at = datetime.utcnow().isoformat()
+        phase.started_at = _utcnow_iso()
         self._log(LogLevel.INFO, f"Starting phase: {phase.name}", phase_id=phase.id)
         self._emit_progress()
         
         start_time = datetime.utcnow()
         
         for task_idx, task in enumerate(phase.tasks):
-            if self._should_cancel:
+            if self._cancel_event.is_set():
                 break
             
-            while self._is_paused:
-                await asyncio.sleep(0.1)
+            await self._run_event.wait()
             
             phase.current_task_index = task_idx
             await self._execute_task(task, phase.id)
@@ -682,9 +971,9 @@ class ExecutionEngine:
                 phase.status = PhaseStatus.FAILED
                 break
         
-        if not self._should_cancel and phase.status != PhaseStatus.FAILED:
+        if not self._cancel_event.is_set() and phase.status != PhaseStatus.FAILED:
             phase.status = PhaseStatus.COMPLETED
-            phase.completed_at = datetime.utcnow().isoformat()
+            phase.completed_at = _utcnow_iso()
             self._log(LogLevel.SUCCESS, f"Phase complete: {phase.name}", phase_id=phase.id)
         
         duration = (datetime.utcnow() - start_time).total_seconds() / 60
@@ -693,7 +982,7 @@ class ExecutionEngine:
     async def _execute_task(self, task: ExecutionTask, phase_id: str):
         """Execute a single task."""
         task.status = PhaseStatus.RUNNING
-        task.started_at = datetime.utcnow().isoformat()
+        task.started_at = _utcnow_iso()
         self._log(LogLevel.INFO, f"Starting: {task.name}", phase_id=phase_id, task_id=task.id)
         
         start_time = datetime.utcnow()
@@ -702,22 +991,28 @@ class ExecutionEngine:
             # Simulate task execution with progress updates
             steps = 10
             for i in range(steps):
-                if self._should_cancel:
+                if self._cancel_event.is_set():
                     break
                 
-                while self._is_paused:
-                    await asyncio.sleep(0.1)
+                await self._run_event.wait()
                 
                 task.progress_percent = ((i + 1) / steps) * 100
                 task.current_step = f"Step {i + 1}/{steps}"
                 self._emit_progress()
                 
-                # Simulate work
-                await asyncio.sleep(task.estimated_duration_seconds / steps)
+                # Simulate work; a cancel ends the wait immediately
+                try:
+                    await asyncio.wait_for(
+                        self._cancel_event.wait(),
+                        timeout=task.estimated_duration_seconds / steps,
+                    )
+                    break
+                except TimeoutError:
+                    pass
             
-            if not self._should_cancel:
+            if not self._cancel_event.is_set():
                 task.status = PhaseStatus.COMPLETED
-                task.completed_at = datetime.utcnow().isoformat()
+                task.completed_at = _utcnow_iso()
                 task.progress_percent = 100
                 self._log(LogLevel.SUCCESS, f"Completed: {task.name}", phase_id=phase_id, task_id=task.id)
             
@@ -732,22 +1027,22 @@ class ExecutionEngine:
     
     def pause(self):
         """Pause execution."""
-        self._is_paused = True
+        self._run_event.clear()
         self.plan.status = PhaseStatus.PENDING  # Using PENDING as "paused"
         self._log(LogLevel.WARN, "Execution paused")
         self._emit_progress()
     
     def resume(self):
         """Resume execution."""
-        self._is_paused = False
+        self._run_event.set()
         self.plan.status = PhaseStatus.RUNNING
         self._log(LogLevel.INFO, "Execution resumed")
         self._emit_progress()
     
     def cancel(self):
         """Cancel execution."""
-        self._should_cancel = True
-        self._is_paused = False
+        self._cancel_event.set()
+        self._run_event.set()
         self._log(LogLevel.WARN, "Execution cancelled")
 
 
@@ -764,90 +1059,90 @@ def generate_refactoring_plan(
     """
     
     plan = ExecutionPlan(
-        id=str(uuid4()),
+        id=next_id(),
         project_path=analysis.project_path,
         name=f"{analysis.project_name} → {target.title()} Refactoring",
         description=f"Complete refactoring with Block Engine, Real-time Sync, and ADHD optimizations",
-        created_at=datetime.utcnow().isoformat(),
+        created_at=_utcnow_iso(),
         estimated_duration_minutes=45
     )
     
     # Phase 1: Discovery
     plan.phases.append(ExecutionPhase(
-        id=str(uuid4()),
+        id=next_id(),
         name="Phase 1: Discovery",
         description="Analyze current codebase structure and dependencies",
         order=0,
         estimated_duration_minutes=5,
         tasks=[
-            ExecutionTask(id=str(uuid4()), name="Scan file structure", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=2),
-            ExecutionTask(id=str(uuid4()), name="Parse dependencies", description="", order=1, task_type=TaskType.ANALYZE, target_file="package.json", estimated_duration_seconds=1),
-            ExecutionTask(id=str(uuid4()), name="Identify tech stack", description="", order=2, task_type=TaskType.ANALYZE, estimated_duration_seconds=1),
-            ExecutionTask(id=str(uuid4()), name="Map component hierarchy", description="", order=3, task_type=TaskType.ANALYZE, estimated_duration_seconds=5),
-            ExecutionTask(id=str(uuid4()), name="Extract existing features", description="", order=4, task_type=TaskType.ANALYZE, estimated_duration_seconds=3),
+            ExecutionTask(id=next_id(), name="Scan file structure", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=2),
+            ExecutionTask(id=next_id(), name="Parse dependencies", description="", order=1, task_type=TaskType.ANALYZE, target_file="package.json", estimated_duration_seconds=1),
+            ExecutionTask(id=next_id(), name="Identify tech stack", description="", order=2, task_type=TaskType.ANALYZE, estimated_duration_seconds=1),
+            ExecutionTask(id=next_id(), name="Map component hierarchy", description="", order=3, task_type=TaskType.ANALYZE, estimated_duration_seconds=5),
+            ExecutionTask(id=next_id(), name="Extract existing features", description="", order=4, task_type=TaskType.ANALYZE, estimated_duration_seconds=3),
         ]
     ))
     
     # Phase 2: Architecture Analysis
     plan.phases.append(ExecutionPhase(
-        id=str(uuid4()),
+        id=next_id(),
         name="Phase 2: Architecture Analysis",
         description="Evaluate patterns and generate improvement recommendations",
         order=1,
         estimated_duration_minutes=8,
         tasks=[
-            ExecutionTask(id=str(uuid4()), name="Evaluate current patterns", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=10),
-            ExecutionTask(id=str(uuid4()), name="Identify scalability bottlenecks", description="", order=1, task_type=TaskType.ANALYZE, estimated_duration_seconds=15),
-            ExecutionTask(id=str(uuid4()), name="Generate improvement recommendations", description="", order=2, task_type=TaskType.GENERATE, estimated_duration_seconds=30),
-            ExecutionTask(id=str(uuid4()), name="Compare with Notion architecture", description="", order=3, task_type=TaskType.ANALYZE, estimated_duration_seconds=20),
-            ExecutionTask(id=str(uuid4()), name="Propose new system design", description="", order=4, task_type=TaskType.GENERATE, estimated_duration_seconds=45),
+            ExecutionTask(id=next_id(), name="Evaluate current patterns", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=10),
+            ExecutionTask(id=next_id(), name="Identify scalability bottlenecks", description="", order=1, task_type=TaskType.ANALYZE, estimated_duration_seconds=15),
+            ExecutionTask(id=next_id(), name="Generate improvement recommendations", description="", order=2, task_type=TaskType.GENERATE, estimated_duration_seconds=30),
+            ExecutionTask(id=next_id(), name="Compare with Notion architecture", description="", order=3, task_type=TaskType.ANALYZE, estimated_duration_seconds=20),
+            ExecutionTask(id=next_id(), name="Propose new system design", description="", order=4, task_type=TaskType.GENERATE, estimated_duration_seconds=45),
         ]
     ))
     
     # Phase 3: UI/UX Redesign
     plan.phases.append(ExecutionPhase(
-        id=str(uuid4()),
+        id=next_id(),
         name="Phase 3: UI/UX Redesign",
         description="Create ADHD-optimized design system and mockups",
         order=2,
         estimated_duration_minutes=12,
         tasks=[
-            ExecutionTask(id=str(uuid4()), name="Analyze current UI patterns", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=20),
-            ExecutionTask(id=str(uuid4()), name="Generate ADHD-optimized design system", description="", order=1, task_type=TaskType.GENERATE, estimated_duration_seconds=60),
-            ExecutionTask(id=str(uuid4()), name="Create component mockups", description="", order=2, task_type=TaskType.GENERATE, estimated_duration_seconds=120),
-            ExecutionTask(id=str(uuid4()), name="Build interactive prototype", description="", order=3, task_type=TaskType.CREATE, estimated_duration_seconds=180),
+            ExecutionTask(id=next_id(), name="Analyze current UI patterns", description="", order=0, task_type=TaskType.ANALYZE, estimated_duration_seconds=20),
+            ExecutionTask(id=next_id(), name="Generate ADHD-optimized design system", description="", order=1, task_type=TaskType.GENERATE, estimated_duration_seconds=60),
+            ExecutionTask(id=next_id(), name="Create component mockups", description="", order=2, task_type=TaskType.GENERATE, estimated_duration_seconds=120),
+            ExecutionTask(id=next_id(), name="Build interactive prototype", description="", order=3, task_type=TaskType.CREATE, estimated_duration_seconds=180),
         ]
     ))
     
     # Phase 4: Block Engine Core (P0)
     plan.phases.append(ExecutionPhase(
-        id=str(uuid4()),
+        id=next_id(),
         name="Phase 4: Block Engine Core (P0)",
         description="Implement base Block model and editor",
         order=3,
         estimated_duration_minutes=10,
         tasks=[
-            ExecutionTask(id=str(uuid4()), name="Create Block model schema", description="", order=0, task_type=TaskType.CREATE, target_file="backend/models/block.py", estimated_duration_seconds=30),
-            ExecutionTask(id=str(uuid4()), name="Create Block API endpoints", description="", order=1, task_type=TaskType.CREATE, target_file="backend/routers/blocks.py", estimated_duration_seconds=60),
-            ExecutionTask(id=str(uuid4()), name="Create BlockEditor component", description="", order=2, task_type=TaskType.CREATE, target_file="frontend/components/BlockEditor.tsx", estimated_duration_seconds=120),
-            ExecutionTask(id=str(uuid4()), name="Implement block types", description="", order=3, task_type=TaskType.CREATE, estimated_duration_seconds=90),
-            ExecutionTask(id=str(uuid4()), name="Add nested blocks support", description="", order=4, task_type=TaskType.MODIFY, estimated_duration_seconds=60),
+            ExecutionTask(id=next_id(), name="Create Block model schema", description="", order=0, task_type=TaskType.CREATE, target_file="backend/models/block.py", estimated_duration_seconds=30),
+            ExecutionTask(id=next_id(), name="Create Block API endpoints", description="", order=1, task_type=TaskType.CREATE, target_file="backend/routers/blocks.py", estimated_duration_seconds=60),
+            ExecutionTask(id=next_id(), name="Create BlockEditor component", description="", order=2, task_type=TaskType.CREATE, target_file="frontend/components/BlockEditor.tsx", estimated_duration_seconds=120),
+            ExecutionTask(id=next_id(), name="Implement block types", description="", order=3, task_type=TaskType.CREATE, estimated_duration_seconds=90),
+            ExecutionTask(id=next_id(), name="Add nested blocks support", description="", order=4, task_type=TaskType.MODIFY, estimated_duration_seconds=60),
         ]
     ))
     
     # Phase 5: Real-time Sync (P1)
     plan.phases.append(ExecutionPhase(
-        id=str(uuid4()),
+        id=next_id(),
         name="Phase 5: Real-time Sync (P1)",
         description="Implement WebSocket sync and CRDT",
         order=4,
         estimated_duration_minutes=10,
         tasks=[
-            ExecutionTask(id=str(uuid4()), name="Setup WebSocket endpoint", description="", order=0, task_type=TaskType.CREATE, target_file="backend/routers/sync.py", estimated_duration_seconds=30),
-            ExecutionTask(id=str(uuid4()), name="Implement event broadcast", description="", order=1, task_type=TaskType.CREATE, estimated_duration_seconds=45),
-            ExecutionTask(id=str(uuid4()), name="Create useSync hook", description="", order=2, task_type=TaskType.CREATE, target_file="frontend/hooks/useSync.ts", estimated_duration_seconds=60),
-            ExecutionTask(id=str(uuid4()), name="Implement optimistic updates", description="", order=3, task_type=TaskType.MODIFY, estimated_duration_seconds=90),
-            ExecutionTask(id=str(uuid4()), name="Add conflict resolution", description="", order=4, task_type=TaskType.CREATE, estimated_duration_seconds=120),
+            ExecutionTask(id=next_id(), name="Setup WebSocket endpoint", description="", order=0, task_type=TaskType.CREATE, target_file="backend/routers/sync.py", estimated_duration_seconds=30),
+            ExecutionTask(id=next_id(), name="Implement event broadcast", description="", order=1, task_type=TaskType.CREATE, estimated_duration_seconds=45),
+            ExecutionTask(id=next_id(), name="Create useSync hook", description="", order=2, task_type=TaskType.CREATE, target_file="frontend/hooks/useSync.ts", estimated_duration_seconds=60),
+            ExecutionTask(id=next_id(), name="Implement optimistic updates", description="", order=3, task_type=TaskType.MODIFY, estimated_duration_seconds=90),
+            ExecutionTask(id=next_id(), name="Add conflict resolution", description="", order=4, task_type=TaskType.CREATE, estimated_duration_seconds=120),
         ]
     ))
     
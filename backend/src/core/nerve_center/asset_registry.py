@@ -13,11 +13,22 @@ This is NH's "memory" of what resources exist and how to use them.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, FrozenSet, Iterator, Tuple, Mapping, get_origin
 from dataclasses import dataclass, field
+from itertools import islice
 from uuid import uuid4
 import json
 
+from .codegen import to_dict_builder
+from .enums import ProjectPriority, TaskComplexity
+from .slots import watch_slot
+
+# orjson is optional; to_json falls back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ==========================================================================
 # Enums
@@ -55,15 +66,6 @@ class ProjectStatus(str, Enum):
     ABANDONED = "abandoned"
 
 
-class ProjectPriority(str, Enum):
-    """Project priority levels"""
-    CRITICAL = "critical"      # NH core, income-generating
-    HIGH = "high"              # Important for goals
-    MEDIUM = "medium"          # Nice to have
-    LOW = "low"                # Backburner
-    EXPERIMENTAL = "experimental"  # Learning/exploration
-
-
 class AIToolCapability(str, Enum):
     """What AI tools can do"""
     CODE_GENERATION = "code_generation"
@@ -80,21 +82,51 @@ class AIToolCapability(str, Enum):
     DEVOPS = "devops"
 
 
-class TaskComplexity(str, Enum):
-    """Task complexity for delegation"""
-    TRIVIAL = "trivial"        # Simple, repetitive
-    LOW = "low"                # Straightforward
-    MEDIUM = "medium"          # Some nuance required
-    HIGH = "high"              # Complex reasoning
-    CRITICAL = "critical"      # Mission-critical, needs best
+# Position of each complexity in declaration order, for range checks
+_COMPLEXITY_ORDINAL: Dict[TaskComplexity, int] = {
+    c: i for i, c in enumerate(TaskComplexity)
+}
+
+
+# Upper-cased priority labels used by AssetRegistry.summary()
+_PRIORITY_LABEL: Dict[ProjectPriority, str] = {
+    p: p.value.upper() for p in ProjectPriority
+}
+
+
+# ==========================================================================
+# Helpers
+# ==========================================================================
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (naive, as stored on assets)"""
+    return datetime.utcnow().isoformat()
+
+
+def _asset_field_value(f: Any) -> Optional[str]:
+    # Frozenset fields are emitted as sorted lists so the output is JSON-safe
+    # and stable across runs
+    return "sorted({})" if get_origin(f.type) is frozenset else None
+
+
+# Per asset class: to_dict skipping None values
+_to_dict_fn = to_dict_builder(skip_none=True, nested=_asset_field_value)
 
 
 # ==========================================================================
 # Base Asset
 # ==========================================================================
 
-@dataclass
-class Asset:
+class _AssetSlots:
+    # Non-field slot: the registry holding the asset, which its indexed
+    # fields report changes to. Declared on a base so it stays out of
+    # fields() and to_dict().
+    __slots__ = ("_registry",)
+    _registry: Optional["AssetRegistry"]
+
+
+@dataclass(slots=True)
+class Asset(_AssetSlots):
     """Base class for all assets"""
     id: str = field(default_factory=lambda: str(uuid4()))
     name: str = ""
@@ -104,23 +136,28 @@ class Asset:
     tags: List[str] = field(default_factory=list)
     
     # Metadata
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = ""  # defaults to created_at
     notes: str = ""
     
     # Links
     url: Optional[str] = None
     documentation_url: Optional[str] = None
     
+    def __post_init__(self):
+        # One clock read per asset; a new asset hasn't been updated yet
+        if not self.updated_at:
+            self.updated_at = self.created_at
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return _to_dict_fn(type(self))(self)
 
 
 # ==========================================================================
 # Hardware Assets
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class HardwareAsset(Asset):
     """Physical hardware"""
     type: AssetType = AssetType.HARDWARE
@@ -147,7 +184,7 @@ class HardwareAsset(Asset):
 # Service/Subscription Assets
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ServiceAsset(Asset):
     """Software service or subscription"""
     type: AssetType = AssetType.SERVICE
@@ -174,7 +211,7 @@ class ServiceAsset(Asset):
     auto_renew: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class APIAsset(Asset):
     """API access"""
     type: AssetType = AssetType.API
@@ -203,7 +240,7 @@ class APIAsset(Asset):
 # AI Tool Assets
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AIToolAsset(Asset):
     """AI tool or model"""
     type: AssetType = AssetType.AI_TOOL
@@ -214,7 +251,7 @@ class AIToolAsset(Asset):
     cli_command: Optional[str] = None
     
     # Capabilities - what it's good at
-    capabilities: List[AIToolCapability] = field(default_factory=list)
+    capabilities: FrozenSet[AIToolCapability] = field(default_factory=frozenset)
     
     # Optimal use cases
     best_for: List[str] = field(default_factory=list)
@@ -239,11 +276,29 @@ class AIToolAsset(Asset):
     cost_per_1k_output_tokens: float = 0.0
 
 
+def _invalidate_capabilities(tool: AIToolAsset, old: Any, new: Any) -> Any:
+    """Setter hook dropping the registry's capability index on a change"""
+    registry = getattr(tool, "_registry", None)
+    if registry is not None and old != new:
+        registry._capability_index = None
+    return new
+
+
+def _on_tool_capabilities(tool: AIToolAsset, old: Any, new: Any) -> Any:
+    # Accept any iterable, store a frozenset for O(1) membership
+    return _invalidate_capabilities(tool, old, frozenset(new))
+
+
+# Deactivating a tool or changing what it can do rebuilds the capability index
+watch_slot(AIToolAsset, "status", _invalidate_capabilities)
+watch_slot(AIToolAsset, "capabilities", _on_tool_capabilities)
+
+
 # ==========================================================================
 # Project Assets
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ProjectAsset(Asset):
     """Project definition"""
     type: AssetType = AssetType.PROJECT
@@ -281,19 +336,41 @@ class ProjectAsset(Asset):
     monetization_strategy: str = ""
     
     # Dependencies
-    depends_on_projects: List[str] = field(default_factory=list)  # Project IDs
-    depends_on_assets: List[str] = field(default_factory=list)    # Asset IDs
+    depends_on_projects: FrozenSet[str] = field(default_factory=frozenset)  # Project IDs
+    depends_on_assets: FrozenSet[str] = field(default_factory=frozenset)    # Asset IDs
     
     # NH integration
     nh_layer: Optional[int] = None  # Which NH layer this belongs to
     can_delegate_to: List[str] = field(default_factory=list)  # AI tools that can work on this
+    
+    def __post_init__(self):
+        Asset.__post_init__(self)
+        self.depends_on_projects = frozenset(self.depends_on_projects)
+        self.depends_on_assets = frozenset(self.depends_on_assets)
+
+
+def _reindex_on_set(index_name: str) -> Callable[[ProjectAsset, Any, Any], Any]:
+    """Setter hook moving a project between its registry's index buckets"""
+    def on_set(project, old, new):
+        registry = getattr(project, "_registry", None)
+        if registry is not None and old != new:
+            index = getattr(registry, index_name)
+            index.get(old, {}).pop(project.id, None)
+            index.setdefault(new, {})[project.id] = None
+        return new
+    return on_set
+
+
+# Plain assignments keep AssetRegistry's project indexes current
+watch_slot(ProjectAsset, "project_status", _reindex_on_set("_projects_by_status"))
+watch_slot(ProjectAsset, "priority", _reindex_on_set("_projects_by_priority"))
 
 
 # ==========================================================================
 # Infrastructure Assets
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class InfrastructureAsset(Asset):
     """Infrastructure/Platform assets"""
     type: AssetType = AssetType.INFRASTRUCTURE
@@ -323,21 +400,21 @@ class InfrastructureAsset(Asset):
 # Tool Delegation Rules
 # ==========================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DelegationRule:
-    """Rule for delegating work to AI tools"""
+    """Rule for delegating work to AI tools (immutable, hashable)"""
     id: str = field(default_factory=lambda: str(uuid4()))
     name: str = ""
     description: str = ""
     
     # Conditions
-    task_types: List[AIToolCapability] = field(default_factory=list)
+    task_types: Tuple[AIToolCapability, ...] = ()
     complexity_range: tuple = (TaskComplexity.TRIVIAL, TaskComplexity.CRITICAL)
-    project_priorities: List[ProjectPriority] = field(default_factory=list)
+    project_priorities: Tuple[ProjectPriority, ...] = ()
     
     # Target tool
     primary_tool: str = ""  # AI tool ID
-    fallback_tools: List[str] = field(default_factory=list)
+    fallback_tools: Tuple[str, ...] = ()
     
     # Rationale
     rationale: str = ""
@@ -346,13 +423,37 @@ class DelegationRule:
     requires_review: bool = False
     max_autonomous_changes: int = 10  # Max files to change without review
     
+    def __post_init__(self):
+        # Accept lists from callers; store tuples so the rule stays hashable
+        for name in ("task_types", "complexity_range", "project_priorities", "fallback_tools"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
 
-@dataclass
+@dataclass(slots=True)
 class DelegationMatrix:
     """Complete delegation configuration"""
     rules: List[DelegationRule] = field(default_factory=list)
     default_tool: str = ""  # Default AI tool ID
     
+    # Rules per task type, in rule order; built on first lookup
+    _by_task_type: Optional[Dict[AIToolCapability, List[DelegationRule]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def add_rule(self, rule: DelegationRule):
+        """Append a rule, invalidating the task-type index"""
+        self.rules.append(rule)
+        self._by_task_type = None
+    
+    def reindex(self):
+        """Rebuild the task-type index after modifying self.rules directly"""
+        index: Dict[AIToolCapability, List[DelegationRule]] = {}
+        for rule in self.rules:
+            for task_type in dict.fromkeys(rule.task_types):
+                index.setdefault(task_type, []).append(rule)
+        self._by_task_type = index
+    
     def get_tool_for_task(
         self,
         task_type: AIToolCapability,
@@ -360,15 +461,16 @@ class DelegationMatrix:
         project_priority: ProjectPriority = None,
     ) -> str:
         """Find best tool for a task"""
-        for rule in self.rules:
-            if task_type in rule.task_types:
-                min_c, max_c = rule.complexity_range
-                complexity_order = list(TaskComplexity)
-                if (complexity_order.index(min_c) <= 
-                    complexity_order.index(complexity) <= 
-                    complexity_order.index(max_c)):
-                    if not rule.project_priorities or project_priority in rule.project_priorities:
-                        return rule.primary_tool
+        if self._by_task_type is None:
+            self.reindex()
+        
+        for rule in self._by_task_type.get(task_type, ()):
+            min_c, max_c = rule.complexity_range
+            if (_COMPLEXITY_ORDINAL[min_c] <= 
+                _COMPLEXITY_ORDINAL[complexity] <= 
+                _COMPLEXITY_ORDINAL[max_c]):
+                if not rule.project_priorities or project_priority in rule.project_priorities:
+                    return rule.primary_tool
         
         return self.default_tool
 
@@ -377,61 +479,181 @@ class DelegationMatrix:
 # Asset Registry
 # ==========================================================================
 
-@dataclass
-class AssetRegistry:
+# Asset class -> AssetRegistry collection attribute, in add_asset precedence order
+_COLLECTION_FOR_TYPE: Dict[type, str] = {
+    HardwareAsset: "hardware",
+    ServiceAsset: "services",
+    APIAsset: "apis",
+    AIToolAsset: "ai_tools",
+    ProjectAsset: "projects",
+    InfrastructureAsset: "infrastructure",
+}
+
+
+def _collection_name(asset: Asset) -> Optional[str]:
+    """AssetRegistry collection attribute for an asset, or None if unregistered"""
+    name = _COLLECTION_FOR_TYPE.get(type(asset))
+    if name is None:
+        # Subclasses of the registered asset types
+        name = next(
+            (n for cls, n in _COLLECTION_FOR_TYPE.items() if isinstance(asset, cls)),
+            None,
+        )
+    return name
+
+
+class _CollectionView(Mapping[str, Any]):
+    """
+    Read-only view of one registry collection: the collection's IDs from
+    the type index, resolved through the registry's single asset map.
+    """
+    __slots__ = ("_assets", "_ids")
+    
+    def __init__(self, assets: Dict[str, Asset], ids: Dict[str, None]):
+        self._assets = assets
+        self._ids = ids
+    
+    def __getitem__(self, asset_id: str) -> Any:
+        if asset_id not in self._ids:
+            raise KeyError(asset_id)
+        return self._assets[asset_id]
+    
+    def __contains__(self, asset_id: object) -> bool:
+        return asset_id in self._ids
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class _RegistrySlots:
+    # Non-field slots, kept out of fields()/replace()/repr():
+    __slots__ = (
+        "_assets",
+        "_ids_by_collection",
+        "_projects_by_status",
+        "_projects_by_priority",
+        "_capability_index",
+    )
+    # Every registered asset by ID; an ID lives in exactly one collection
+    _assets: Dict[str, Asset]
+    # Collection attribute -> IDs of its assets (dicts used as ordered sets)
+    _ids_by_collection: Dict[str, Dict[str, None]]
+    # Project IDs per status / priority
+    _projects_by_status: Dict[ProjectStatus, Dict[str, None]]
+    _projects_by_priority: Dict[ProjectPriority, Dict[str, None]]
+    # Capability -> active AI tool IDs; rebuilt on demand after tool changes
+    _capability_index: Optional[Dict[AIToolCapability, List[str]]]
+    
+    def __new__(cls, *args: Any, **kwargs: Any) -> "_RegistrySlots":
+        # The indexes have to exist before __init__ assigns the collections
+        self = super().__new__(cls)
+        self._assets = {}
+        self._ids_by_collection = {name: {} for name in _COLLECTION_FOR_TYPE.values()}
+        self._projects_by_status = {}
+        self._projects_by_priority = {}
+        self._capability_index = None
+        return self
+
+
+@dataclass(slots=True)
+class AssetRegistry(_RegistrySlots):
     """Central registry of all assets"""
     
-    # Collections
-    hardware: Dict[str, HardwareAsset] = field(default_factory=dict)
-    services: Dict[str, ServiceAsset] = field(default_factory=dict)
-    apis: Dict[str, APIAsset] = field(default_factory=dict)
-    ai_tools: Dict[str, AIToolAsset] = field(default_factory=dict)
-    projects: Dict[str, ProjectAsset] = field(default_factory=dict)
-    infrastructure: Dict[str, InfrastructureAsset] = field(default_factory=dict)
+    # Collections: read-only views over one asset map, so get_asset and the
+    # project/capability indexes can't be bypassed. Use add_asset/remove_asset
+    # (or assign a whole new mapping).
+    hardware: Mapping[str, HardwareAsset] = field(default_factory=dict)
+    services: Mapping[str, ServiceAsset] = field(default_factory=dict)
+    apis: Mapping[str, APIAsset] = field(default_factory=dict)
+    ai_tools: Mapping[str, AIToolAsset] = field(default_factory=dict)
+    projects: Mapping[str, ProjectAsset] = field(default_factory=dict)
+    infrastructure: Mapping[str, InfrastructureAsset] = field(default_factory=dict)
     
     # Delegation
     delegation_matrix: DelegationMatrix = field(default_factory=DelegationMatrix)
     
     # Metadata
-    last_updated: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_updated: str = field(default_factory=_now_iso)
     version: str = "1.0.0"
     
-    def add_asset(self, asset: Asset):
-        """Add asset to appropriate collection"""
-        if isinstance(asset, HardwareAsset):
-            self.hardware[asset.id] = asset
-        elif isinstance(asset, ServiceAsset):
-            self.services[asset.id] = asset
-        elif isinstance(asset, APIAsset):
-            self.apis[asset.id] = asset
+    def _insert(self, name: str, asset: Asset):
+        # Re-adding an ID replaces the asset, whichever collection held it
+        if asset.id in self._assets:
+            self._discard(asset.id)
+        self._assets[asset.id] = asset
+        self._ids_by_collection[name][asset.id] = None
+        
+        # The asset reports changes to its indexed fields from here on
+        asset._registry = self
+        if isinstance(asset, ProjectAsset):
+            self._projects_by_status.setdefault(asset.project_status, {})[asset.id] = None
+            self._projects_by_priority.setdefault(asset.priority, {})[asset.id] = None
         elif isinstance(asset, AIToolAsset):
-            self.ai_tools[asset.id] = asset
-        elif isinstance(asset, ProjectAsset):
-            self.projects[asset.id] = asset
-        elif isinstance(asset, InfrastructureAsset):
-            self.infrastructure[asset.id] = asset
+            self._capability_index = None
+    
+    def _discard(self, asset_id: str) -> Optional[Asset]:
+        asset = self._assets.pop(asset_id, None)
+        if asset is None:
+            return None
+        self._ids_by_collection[_collection_name(asset)].pop(asset_id, None)
         
-        self.last_updated = datetime.utcnow().isoformat()
+        if getattr(asset, "_registry", None) is self:
+            asset._registry = None
+        if isinstance(asset, ProjectAsset):
+            self._projects_by_status.get(asset.project_status, {}).pop(asset.id, None)
+            self._projects_by_priority.get(asset.priority, {}).pop(asset.id, None)
+        elif isinstance(asset, AIToolAsset):
+            self._capability_index = None
+        return asset
+    
+    def add_asset(self, asset: Asset):
+        """Add asset to appropriate collection"""
+        name = _collection_name(asset)
+        if name is not None:
+            self._insert(name, asset)
+        self.last_updated = _now_iso()
     
     def get_asset(self, asset_id: str) -> Optional[Asset]:
         """Get asset by ID from any collection"""
-        for collection in [
-            self.hardware, self.services, self.apis,
-            self.ai_tools, self.projects, self.infrastructure
-        ]:
-            if asset_id in collection:
-                return collection[asset_id]
-        return None
+        return self._assets.get(asset_id)
+    
+    def update_asset(self, asset_id: str, **changes: Any) -> Optional[Asset]:
+        """Update fields of a registered asset"""
+        asset = self.get_asset(asset_id)
+        if asset is None:
+            return None
+        
+        for name, value in changes.items():
+            setattr(asset, name, value)
+        
+        asset.updated_at = _now_iso()
+        self.last_updated = asset.updated_at
+        return asset
+    
+    def remove_asset(self, asset_id: str) -> Optional[Asset]:
+        """Remove asset by ID from whichever collection holds it"""
+        asset = self._discard(asset_id)
+        if asset is not None:
+            self.last_updated = _now_iso()
+        return asset
     
     def get_active_projects(self) -> List[ProjectAsset]:
         """Get all active projects"""
-        return [p for p in self.projects.values() 
-                if p.project_status == ProjectStatus.ACTIVE]
+        assets = self._assets
+        return [assets[pid]
+                for pid in self._projects_by_status.get(ProjectStatus.ACTIVE, ())]
     
     def get_projects_by_priority(self, priority: ProjectPriority) -> List[ProjectAsset]:
         """Get projects by priority"""
-        return [p for p in self.projects.values() 
-                if p.priority == priority]
+        assets = self._assets
+        return [assets[pid]
+                for pid in self._projects_by_priority.get(priority, ())]
     
     def get_tool_for_task(
         self,
@@ -447,26 +669,28 @@ class AssetRegistry:
     
     def get_available_capabilities(self) -> Dict[AIToolCapability, List[str]]:
         """Get all available capabilities and which tools provide them"""
-        capabilities = {}
-        for tool in self.ai_tools.values():
-            if tool.status == AssetStatus.ACTIVE:
-                for cap in tool.capabilities:
-                    if cap not in capabilities:
-                        capabilities[cap] = []
-                    capabilities[cap].append(tool.id)
-        return capabilities
+        if self._capability_index is None:
+            capabilities = {}
+            for tool in self.ai_tools.values():
+                if tool.status == AssetStatus.ACTIVE:
+                    # Declaration order keeps the result stable for set-valued capabilities
+                    for cap in AIToolCapability:
+                        if cap in tool.capabilities:
+                            capabilities.setdefault(cap, []).append(tool.id)
+            self._capability_index = capabilities
+        # Copy so callers can't mutate the cached index
+        return {cap: list(ids) for cap, ids in self._capability_index.items()}
     
     def estimate_monthly_costs(self) -> Dict[str, float]:
         """Estimate total monthly costs"""
+        services = sum(s.monthly_cost_usd for s in self.services.values() 
+                       if s.status == AssetStatus.ACTIVE)
+        infrastructure = sum(i.monthly_cost_usd for i in self.infrastructure.values()
+                             if i.status == AssetStatus.ACTIVE)
         return {
-            "services": sum(s.monthly_cost_usd for s in self.services.values() 
-                          if s.status == AssetStatus.ACTIVE),
-            "infrastructure": sum(i.monthly_cost_usd for i in self.infrastructure.values()
-                                 if i.status == AssetStatus.ACTIVE),
-            "total": sum(s.monthly_cost_usd for s in self.services.values() 
-                        if s.status == AssetStatus.ACTIVE) +
-                    sum(i.monthly_cost_usd for i in self.infrastructure.values()
-                        if i.status == AssetStatus.ACTIVE)
+            "services": services,
+            "infrastructure": infrastructure,
+            "total": services + infrastructure,
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -484,28 +708,66 @@ class AssetRegistry:
     
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON"""
+        # orjson only indents by two spaces; other widths use the stdlib
+        if orjson is not None and indent == 2:
+            return orjson.dumps(
+                self.to_dict(),
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
         return json.dumps(self.to_dict(), indent=indent, default=str)
     
     def summary(self) -> str:
         """Generate human-readable summary"""
-        active_projects = self.get_active_projects()
+        active_ids = self._projects_by_status.get(ProjectStatus.ACTIVE, {})
         costs = self.estimate_monthly_costs()
         
-        return f"""
-NH Asset Registry Summary
-=========================
-
-Hardware Assets: {len(self.hardware)}
-Services/Subscriptions: {len(self.services)}
-API Integrations: {len(self.apis)}
-AI Tools: {len(self.ai_tools)}
-Projects: {len(self.projects)} ({len(active_projects)} active)
-Infrastructure: {len(self.infrastructure)}
-
-Estimated Monthly Costs: ${costs['total']:.2f}
-
-Active Projects:
-{chr(10).join(f"  - [{p.priority.value.upper()}] {p.name} ({p.completion_percent:.0f}%)" for p in active_projects[:10])}
-
-Last Updated: {self.last_updated}
-"""
+        parts = [
+            "",
+            "NH Asset Registry Summary",
+            "=========================",
+            "",
+            f"Hardware Assets: {len(self.hardware)}",
+            f"Services/Subscriptions: {len(self.services)}",
+            f"API Integrations: {len(self.apis)}",
+            f"AI Tools: {len(self.ai_tools)}",
+            f"Projects: {len(self.projects)} ({len(active_ids)} active)",
+            f"Infrastructure: {len(self.infrastructure)}",
+            "",
+            f"Estimated Monthly Costs: ${costs['total']:.2f}",
+            "",
+            "Active Projects:",
+        ]
+        # Only the first 10 active projects are listed
+        projects = self.projects
+        for pid in islice(active_ids, 10):
+            p = projects[pid]
+            parts.append(
+                f"  - [{_PRIORITY_LABEL[p.priority]}] {p.name} ({p.completion_percent:.0f}%)"
+            )
+        if not active_ids:
+            parts.append("")  # empty list still renders as one blank line
+        parts += ["", f"Last Updated: {self.last_updated}", ""]
+        
+        return "\n".join(parts)
+
+
+def _on_registry_collection(name: str) -> Callable[[AssetRegistry, Any, Any], Any]:
+    """Setter hook loading a collection into the registry, returning its view"""
+    def on_set(registry, old, new):
+        # Copy first: new may be this collection's own view
+        assets = list(new.values())
+        ids = registry._ids_by_collection[name]
+        if old is not None:
+            # A whole new mapping after construction replaces the collection
+            for asset_id in list(ids):
+                registry._discard(asset_id)
+            registry.last_updated = _now_iso()
+        for asset in assets:
+            registry._insert(name, asset)
+        return _CollectionView(registry._assets, ids)
+    return on_set
+
+
+for _name in _COLLECTION_FOR_TYPE.values():
+    watch_slot(AssetRegistry, _name, _on_registry_collection(_name))
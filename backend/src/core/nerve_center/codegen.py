@@ -0,0 +1,63 @@
+"""
+NH Nerve Center - Generated Serializers
+========================================
+
+Used by the Asset Registry and the event state classes to build a to_dict
+specialized to each dataclass's fields, instead of walking fields() (as
+asdict does) on every call.
+"""
+
+from dataclasses import Field, fields
+from functools import cache
+from typing import Any, Callable, Dict, Optional
+
+# nested(f) -> format string wrapping the field's value, or None to keep it
+NestedHook = Callable[["Field[Any]"], Optional[str]]
+
+
+def to_dict_builder(
+    *,
+    skip_none: bool = False,
+    nested: Optional[NestedHook] = None,
+) -> Callable[[type], Callable[[Any], Dict[str, Any]]]:
+    """
+    Return a cached cls -> to_dict function factory.
+
+    Each generated body reads every field as a plain attribute load. With
+    skip_none, fields whose value is None are left out:
+
+        def to_dict(self):
+            d = {}
+            v = self.id
+            if v is not None: d['id'] = v
+            ...
+            return d
+
+    otherwise it is a single dict display. nested(f) may return a format
+    string applied to the value, e.g. "[item.to_dict() for item in {}]".
+    """
+    def value_of(f: "Field[Any]", load: str) -> str:
+        template = nested(f) if nested is not None else None
+        return template.format(load) if template is not None else load
+
+    @cache
+    def to_dict_fn(cls: type) -> Callable[[Any], Dict[str, Any]]:
+        if skip_none:
+            lines = ["def to_dict(self):", "    d = {}"]
+            for f in fields(cls):
+                lines.append(f"    v = self.{f.name}")
+                lines.append(f"    if v is not None: d[{f.name!r}] = {value_of(f, 'v')}")
+            lines.append("    return d")
+        else:
+            lines = ["def to_dict(self):", "    return {"]
+            for f in fields(cls):
+                lines.append(f"        {f.name!r}: {value_of(f, f'self.{f.name}')},")
+            lines.append("    }")
+
+        namespace: Dict[str, Any] = {}
+        exec("\n".join(lines), namespace)
+        fn: Callable[[Any], Dict[str, Any]] = namespace["to_dict"]
+        fn.__qualname__ = f"{cls.__qualname__}.to_dict"
+        return fn
+
+    return to_dict_fn
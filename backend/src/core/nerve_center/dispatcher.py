@@ -41,33 +41,40 @@ Architecture:
 └─────────────────────────────────────────────────────────────────────────┘
 """
 
+import bisect
 import json
-import subprocess
+import logging
+import re
 import asyncio
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, Deque, FrozenSet, Mapping
 from dataclasses import dataclass, field
 from uuid import uuid4
+import httpx
 import structlog
 
 from src.core.config import settings
+from .enums import ProjectPriority, TaskComplexity
 
 logger = structlog.get_logger()
 
+# The stdlib logger structlog hands records to once configured (see api.main);
+# its LoggerFactory names it after this module
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _info_logging_enabled() -> bool:
+    """Whether logger.info() would emit anything"""
+    return not structlog.is_configured() or _stdlib_logger.isEnabledFor(logging.INFO)
+
 
 # ==========================================================================
 # Enums
 # ==========================================================================
 
-class TaskComplexity(str, Enum):
-    TRIVIAL = "trivial"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
-
-
 class TaskType(str, Enum):
     CODE_GENERATION = "code_generation"
     CODE_REVIEW = "code_review"
@@ -87,19 +94,26 @@ class AITool(str, Enum):
     CODEX_CLI = "codex-cli"
 
 
-class ProjectPriority(str, Enum):
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-    EXPERIMENTAL = "experimental"
+# Project priority mapping from registry (read-only)
+_PROJECT_PRIORITIES: Mapping[str, ProjectPriority] = MappingProxyType({
+    "nh": ProjectPriority.CRITICAL,
+    "nhmc": ProjectPriority.CRITICAL,
+    "sw": ProjectPriority.HIGH,
+    "sf": ProjectPriority.HIGH,
+    "toa": ProjectPriority.HIGH,
+    "pf": ProjectPriority.HIGH,
+    "fpr": ProjectPriority.MEDIUM,
+    "cn": ProjectPriority.LOW,
+    "us": ProjectPriority.LOW,
+    "cit": ProjectPriority.EXPERIMENTAL,
+})
 
 
 # ==========================================================================
 # Task Definition
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DispatchTask:
     """A task to be dispatched to an AI tool"""
     id: str = field(default_factory=lambda: str(uuid4()))
@@ -145,14 +159,68 @@ class DispatchTask:
 # Routing Rules
 # ==========================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoutingRule:
-    """Rule for routing tasks to AI tools"""
+    """
+    Rule for routing tasks to AI tools.
+    
+    Each condition is the set of values the task's field may take;
+    None leaves that field unconstrained.
+    """
     name: str
-    conditions: Dict[str, Any]
     target_tool: AITool
     priority: int = 0  # Higher = checked first
     rationale: str = ""
+    
+    # Conditions
+    task_types: Optional[FrozenSet[TaskType]] = None
+    complexities: Optional[FrozenSet[TaskComplexity]] = None
+    project_priorities: Optional[FrozenSet[ProjectPriority]] = None
+    
+    # Compiled condition check, built from the fields above
+    _match: Callable[["DispatchTask"], bool] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        for name in ("task_types", "complexities", "project_priorities"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, frozenset):
+                object.__setattr__(self, name, frozenset(value))
+        object.__setattr__(self, "_match", _compile_matcher(self))
+    
+    def matches(self, task: "DispatchTask") -> bool:
+        """Check if task matches this rule's conditions"""
+        return self._match(task)
+
+
+def _compile_matcher(rule: RoutingRule) -> Callable[[DispatchTask], bool]:
+    """
+    Build the rule's match predicate.
+    
+    The condition sets are captured as closure variables, so a route() call
+    does no attribute lookups on the rule itself; a rule without conditions
+    compiles to a constant predicate.
+    """
+    tt, cx, pp = rule.task_types, rule.complexities, rule.project_priorities
+    
+    if tt is None and cx is None and pp is None:
+        return lambda task: True
+    
+    def match(task: DispatchTask) -> bool:
+        if tt is not None and task.task_type not in tt:
+            return False
+        if cx is not None and task.complexity not in cx:
+            return False
+        if pp is not None and task.project_priority not in pp:
+            return False
+        return True
+    
+    return match
+
+
+def _rule_rank(rule: RoutingRule) -> int:
+    """Sort key placing higher-priority rules first"""
+    return -rule.priority
 
 
 class RoutingEngine:
@@ -162,7 +230,13 @@ class RoutingEngine:
     """
     
     def __init__(self):
+        # Kept sorted by priority (highest first); route() walks it in order
         self.rules = self._build_default_rules()
+        self.rules.sort(key=_rule_rank)
+    
+    def add_rule(self, rule: RoutingRule):
+        """Insert a rule, keeping the list in priority order"""
+        bisect.insort(self.rules, rule, key=_rule_rank)
     
     def _build_default_rules(self) -> List[RoutingRule]:
         """Build routing rules from delegation matrix"""
@@ -170,9 +244,7 @@ class RoutingEngine:
             # Rule 1: NH core ALWAYS goes to Opus
             RoutingRule(
                 name="NH Core to Opus",
-                conditions={
-                    "project_priority": [ProjectPriority.CRITICAL],
-                },
+                project_priorities=frozenset({ProjectPriority.CRITICAL}),
                 target_tool=AITool.CLAUDE_OPUS,
                 priority=100,
                 rationale="Critical projects always use Claude Opus - no exceptions",
@@ -181,10 +253,8 @@ class RoutingEngine:
             # Rule 2: Architecture decisions → Opus
             RoutingRule(
                 name="Architecture to Opus",
-                conditions={
-                    "task_type": [TaskType.ARCHITECTURE],
-                    "complexity": [TaskComplexity.MEDIUM, TaskComplexity.HIGH, TaskComplexity.CRITICAL],
-                },
+                task_types=frozenset({TaskType.ARCHITECTURE}),
+                complexities=frozenset({TaskComplexity.MEDIUM, TaskComplexity.HIGH, TaskComplexity.CRITICAL}),
                 target_tool=AITool.CLAUDE_OPUS,
                 priority=90,
                 rationale="Architecture decisions require highest quality reasoning",
@@ -193,10 +263,8 @@ class RoutingEngine:
             # Rule 3: Complex debugging → Opus
             RoutingRule(
                 name="Complex Debugging to Opus",
-                conditions={
-                    "task_type": [TaskType.DEBUGGING],
-                    "complexity": [TaskComplexity.HIGH, TaskComplexity.CRITICAL],
-                },
+                task_types=frozenset({TaskType.DEBUGGING}),
+                complexities=frozenset({TaskComplexity.HIGH, TaskComplexity.CRITICAL}),
                 target_tool=AITool.CLAUDE_OPUS,
                 priority=85,
                 rationale="Complex bugs need sophisticated analysis",
@@ -205,10 +273,8 @@ class RoutingEngine:
             # Rule 4: Documentation → Gemini (free!)
             RoutingRule(
                 name="Documentation to Gemini",
-                conditions={
-                    "task_type": [TaskType.DOCUMENTATION],
-                    "complexity": [TaskComplexity.TRIVIAL, TaskComplexity.LOW, TaskComplexity.MEDIUM],
-                },
+                task_types=frozenset({TaskType.DOCUMENTATION}),
+                complexities=frozenset({TaskComplexity.TRIVIAL, TaskComplexity.LOW, TaskComplexity.MEDIUM}),
                 target_tool=AITool.GEMINI_CLI,
                 priority=80,
                 rationale="Gemini is free and good for documentation - saves Claude tokens",
@@ -217,11 +283,9 @@ class RoutingEngine:
             # Rule 5: Simple code tasks → Codex
             RoutingRule(
                 name="Simple Code to Codex",
-                conditions={
-                    "task_type": [TaskType.CODE_GENERATION, TaskType.REFACTORING, TaskType.TESTING],
-                    "complexity": [TaskComplexity.TRIVIAL, TaskComplexity.LOW],
-                    "project_priority": [ProjectPriority.LOW, ProjectPriority.EXPERIMENTAL, ProjectPriority.MEDIUM],
-                },
+                task_types=frozenset({TaskType.CODE_GENERATION, TaskType.REFACTORING, TaskType.TESTING}),
+                complexities=frozenset({TaskComplexity.TRIVIAL, TaskComplexity.LOW}),
+                project_priorities=frozenset({ProjectPriority.LOW, ProjectPriority.EXPERIMENTAL, ProjectPriority.MEDIUM}),
                 target_tool=AITool.CODEX_CLI,
                 priority=70,
                 rationale="Simple tasks on non-critical projects - Codex is sufficient",
@@ -230,10 +294,8 @@ class RoutingEngine:
             # Rule 6: Medium complexity code → Sonnet
             RoutingRule(
                 name="Medium Code to Sonnet",
-                conditions={
-                    "task_type": [TaskType.CODE_GENERATION, TaskType.CODE_REVIEW, TaskType.TESTING],
-                    "complexity": [TaskComplexity.LOW, TaskComplexity.MEDIUM],
-                },
+                task_types=frozenset({TaskType.CODE_GENERATION, TaskType.CODE_REVIEW, TaskType.TESTING}),
+                complexities=frozenset({TaskComplexity.LOW, TaskComplexity.MEDIUM}),
                 target_tool=AITool.CLAUDE_SONNET,
                 priority=60,
                 rationale="Sonnet is balanced - good quality, reasonable cost",
@@ -242,10 +304,8 @@ class RoutingEngine:
             # Rule 7: Research → Gemini (large context)
             RoutingRule(
                 name="Research to Gemini",
-                conditions={
-                    "task_type": [TaskType.RESEARCH, TaskType.ANALYSIS],
-                    "complexity": [TaskComplexity.TRIVIAL, TaskComplexity.LOW, TaskComplexity.MEDIUM],
-                },
+                task_types=frozenset({TaskType.RESEARCH, TaskType.ANALYSIS}),
+                complexities=frozenset({TaskComplexity.TRIVIAL, TaskComplexity.LOW, TaskComplexity.MEDIUM}),
                 target_tool=AITool.GEMINI_CLI,
                 priority=50,
                 rationale="Gemini has 1M context window - good for research",
@@ -254,7 +314,6 @@ class RoutingEngine:
             # Default: Sonnet for anything else
             RoutingRule(
                 name="Default to Sonnet",
-                conditions={},  # Matches everything
                 target_tool=AITool.CLAUDE_SONNET,
                 priority=0,
                 rationale="Sonnet is the balanced default choice",
@@ -266,11 +325,8 @@ class RoutingEngine:
         Determine best AI tool for a task.
         Returns tool and sets routing_reason on task.
         """
-        # Sort rules by priority (highest first)
-        sorted_rules = sorted(self.rules, key=lambda r: r.priority, reverse=True)
-        
-        for rule in sorted_rules:
-            if self._matches_rule(task, rule):
+        for rule in self.rules:
+            if rule._match(task):
                 task.assigned_tool = rule.target_tool
                 task.routing_reason = rule.rationale
                 return rule.target_tool
@@ -279,21 +335,13 @@ class RoutingEngine:
         task.assigned_tool = AITool.CLAUDE_SONNET
         task.routing_reason = "No specific rule matched - using default"
         return AITool.CLAUDE_SONNET
-    
-    def _matches_rule(self, task: DispatchTask, rule: RoutingRule) -> bool:
-        """Check if task matches rule conditions"""
-        for field, allowed_values in rule.conditions.items():
-            task_value = getattr(task, field, None)
-            if task_value is not None and task_value not in allowed_values:
-                return False
-        return True
 
 
 # ==========================================================================
 # SyncWave Integration
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SyncWaveNotification:
     """Notification to send via SyncWave"""
     title: str
@@ -304,58 +352,137 @@ class SyncWaveNotification:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
+# Background notification delivery
+NOTIFICATION_QUEUE_SIZE = 1024
+NOTIFICATION_WORKERS = 4
+
+
 class SyncWaveClient:
     """
     Client for sending notifications to SyncWave app.
     SyncWave streams from PC to phone with CC integration.
+    
+    The send_task_* / send_blocker_alert helpers queue their notification
+    and return immediately; background workers deliver it. Call aclose()
+    (or flush()) to wait for delivery.
     """
     
     def __init__(self, api_url: str = None, api_key: str = None):
         self.api_url = api_url or settings.SYNCWAVE_API_URL
         self.api_key = api_key or settings.SYNCWAVE_API_KEY
+        # Pooled HTTP client, created on first send while enabled
+        self._client: Optional[httpx.AsyncClient] = None
+        # Background delivery for send_task_*/send_blocker_alert; started
+        # on first enqueue so the queue binds to the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self.dropped_notifications = 0
     
     @property
     def enabled(self) -> bool:
         """Check if SyncWave is properly configured"""
         return bool(self.api_key) and settings.SYNCWAVE_ENABLED
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=httpx.Timeout(5.0),
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        return self._client
+    
+    def _enqueue(self, notification: SyncWaveNotification):
+        """Queue a notification for background delivery (drops oldest when full)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+            self._workers = [
+                asyncio.create_task(self._notification_worker())
+                for _ in range(NOTIFICATION_WORKERS)
+            ]
+        
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped_notifications += 1
+            self._queue.put_nowait(notification)
+    
+    async def _notification_worker(self):
+        while True:
+            notification = await self._queue.get()
+            try:
+                await self.send_notification(notification)
+            except Exception as e:
+                logger.error("syncwave_dispatcher_error", error=str(e), title=notification.title)
+            finally:
+                self._queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued notification has been delivered"""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def aclose(self):
+        """Deliver queued notifications, then stop workers and close the HTTP client"""
+        if self._queue is not None:
+            await self._queue.join()
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._queue = None
+            self._workers = []
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "SyncWaveClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
     async def send_notification(self, notification: SyncWaveNotification) -> bool:
         """Send notification to SyncWave or log if disabled"""
-        # Log notification (always - for debugging/audit)
-        logger.info(
-            "syncwave_dispatcher_notification",
-            title=notification.title,
-            body=notification.body[:50],
-            priority=notification.priority,
-            category=notification.category,
-            enabled=self.enabled
-        )
+        # Log notification (for debugging/audit), skipping the kwargs when
+        # INFO is filtered out anyway
+        if _info_logging_enabled():
+            logger.info(
+                "syncwave_dispatcher_notification",
+                title=notification.title,
+                body=notification.body[:50],
+                priority=notification.priority,
+                category=notification.category,
+                enabled=self.enabled
+            )
         
         # In disabled mode, just return success (we logged it above)
         if not self.enabled:
             return True
         
-        # TODO: Implement actual SyncWave API call when enabled
-        # import httpx
-        # async with httpx.AsyncClient() as client:
-        #     response = await client.post(
-        #         f"{self.api_url}/api/notifications",
-        #         json={
-        #             "title": notification.title,
-        #             "body": notification.body,
-        #             "priority": notification.priority,
-        #             "category": notification.category,
-        #             "data": notification.data,
-        #         },
-        #         headers={"Authorization": f"Bearer {self.api_key}"}
-        #     )
-        #     return response.status_code == 200
-        
-        return True
+        try:
+            response = await self._get_client().post(
+                "/api/notifications",
+                json={
+                    "title": notification.title,
+                    "body": notification.body,
+                    "priority": notification.priority,
+                    "category": notification.category,
+                    "data": notification.data,
+                },
+            )
+            return response.status_code == 200
+        except httpx.HTTPError as e:
+            logger.error("syncwave_dispatcher_error", error=str(e), title=notification.title)
+            return False
     
     async def send_task_started(self, task: DispatchTask):
         """Notify that task has started"""
-        await self.send_notification(SyncWaveNotification(
+        self._enqueue(SyncWaveNotification(
             title=f"🚀 Task Started: {task.title[:30]}",
             body=f"Assigned to {task.assigned_tool.value}. {task.routing_reason}",
             priority="normal",
@@ -365,7 +492,7 @@ class SyncWaveClient:
     
     async def send_task_completed(self, task: DispatchTask):
         """Notify that task completed successfully"""
-        await self.send_notification(SyncWaveNotification(
+        self._enqueue(SyncWaveNotification(
             title=f"✅ Task Completed: {task.title[:30]}",
             body=f"Finished by {task.assigned_tool.value}",
             priority="normal",
@@ -375,7 +502,7 @@ class SyncWaveClient:
     
     async def send_task_failed(self, task: DispatchTask):
         """Notify that task failed"""
-        await self.send_notification(SyncWaveNotification(
+        self._enqueue(SyncWaveNotification(
             title=f"❌ Task Failed: {task.title[:30]}",
             body=f"Error: {task.error[:50] if task.error else 'Unknown error'}",
             priority="high",
@@ -385,7 +512,7 @@ class SyncWaveClient:
     
     async def send_blocker_alert(self, project_id: str, blocker: str, suggestion: str):
         """Alert when a blocker might be resolvable"""
-        await self.send_notification(SyncWaveNotification(
+        self._enqueue(SyncWaveNotification(
             title=f"🔓 Blocker Update: {project_id}",
             body=f"{blocker} - {suggestion}",
             priority="high",
@@ -405,34 +532,61 @@ class ToolExecutor:
         raise NotImplementedError
 
 
-class GeminiExecutor(ToolExecutor):
-    """Execute tasks via Gemini CLI"""
+class CLIExecutor(ToolExecutor):
+    """
+    Base class for tools driven through a local CLI.
+    
+    The prompt is written to the process's stdin rather than interpolated
+    into a command line, so it is never shell-parsed and is not bounded by
+    the argv size limit.
+    """
+    label: str = ""
+    argv: tuple = ()
+    
+    def __init__(self, dry_run: bool = True):
+        # Dry run only reports the command; pass False to spawn the CLI
+        self.dry_run = dry_run
     
     async def execute(self, task: DispatchTask, prompt: str) -> str:
-        """Run gemini CLI command"""
-        cmd = f'gemini "{prompt}"'
+        """Run the CLI without blocking the event loop"""
+        if self.dry_run:
+            cmd = f'{self.argv[0]} "{prompt}"'
+            return f"[{self.label}] Would execute: {cmd[:100]}..."
         
-        # For safety, we'll just return the command for now
-        # In production, would use subprocess
-        return f"[GEMINI CLI] Would execute: {cmd[:100]}..."
+        proc = await asyncio.create_subprocess_exec(
+            *self.argv,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(prompt.encode()),
+                timeout=task.timeout_minutes * 60,
+            )
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TimeoutError(
+                f"{self.argv[0]} timed out after {task.timeout_minutes} minutes"
+            ) from None
         
-        # Production code:
-        # result = subprocess.run(
-        #     ["gemini", prompt],
-        #     capture_output=True,
-        #     text=True,
-        #     timeout=task.timeout_minutes * 60
-        # )
-        # return result.stdout
+        if proc.returncode != 0:
+            detail = stderr.decode(errors="replace").strip()
+            raise RuntimeError(f"{self.argv[0]} exited with {proc.returncode}: {detail}")
+        return stdout.decode(errors="replace")
 
 
-class CodexExecutor(ToolExecutor):
+class GeminiExecutor(CLIExecutor):
+    """Execute tasks via Gemini CLI"""
+    label = "GEMINI CLI"
+    argv = ("gemini",)
+
+
+class CodexExecutor(CLIExecutor):
     """Execute tasks via Codex CLI"""
-    
-    async def execute(self, task: DispatchTask, prompt: str) -> str:
-        """Run codex CLI command"""
-        cmd = f'codex "{prompt}"'
-        return f"[CODEX CLI] Would execute: {cmd[:100]}..."
+    label = "CODEX CLI"
+    argv = ("codex", "exec", "-")
 
 
 class ClaudeExecutor(ToolExecutor):
@@ -447,10 +601,43 @@ class ClaudeExecutor(ToolExecutor):
         return f"[CLAUDE {self.model}] Would call API with prompt..."
 
 
+# ==========================================================================
+# Task Classification
+# ==========================================================================
+
+def _keyword_pattern(*words: str) -> "re.Pattern[str]":
+    """Regex matching any of the words as a substring, in one C-level scan"""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Checked in order; the first category with a keyword in the description wins
+_TASK_TYPE_PATTERNS = (
+    (TaskType.DOCUMENTATION, _keyword_pattern("document", "readme", "docs", "comment")),
+    (TaskType.TESTING, _keyword_pattern("test", "spec", "unit test")),
+    (TaskType.DEBUGGING, _keyword_pattern("bug", "fix", "error", "issue")),
+    (TaskType.ARCHITECTURE, _keyword_pattern("architect", "design", "structure", "refactor major")),
+    (TaskType.CODE_REVIEW, _keyword_pattern("review", "check", "audit")),
+    (TaskType.RESEARCH, _keyword_pattern("research", "analyze", "investigate")),
+)
+
+_COMPLEXITY_PATTERNS = (
+    (TaskComplexity.LOW, _keyword_pattern("simple", "basic", "quick", "small")),
+    (TaskComplexity.HIGH, _keyword_pattern("complex", "difficult", "major", "critical")),
+    (TaskComplexity.TRIVIAL, _keyword_pattern("trivial", "tiny", "minor")),
+)
+
+
 # ==========================================================================
 # Main Dispatcher
 # ==========================================================================
 
+# Files listed by name in a prompt; any beyond this are summarized as a count
+PROMPT_MAX_FILES = 50
+
+# Finished tasks kept in memory; the oldest are dropped beyond this
+TASK_HISTORY_LIMIT = 10_000
+
+
 class CCDispatcher:
     """
     Claude Code Dispatcher - Central task routing hub.
@@ -462,8 +649,8 @@ class CCDispatcher:
     def __init__(self):
         self.routing_engine = RoutingEngine()
         self.syncwave = SyncWaveClient()
-        self.task_queue: List[DispatchTask] = []
-        self.task_history: List[DispatchTask] = []
+        self.task_queue: Dict[str, DispatchTask] = {}
+        self.task_history: Deque[DispatchTask] = deque(maxlen=TASK_HISTORY_LIMIT)
         
         # Tool executors
         self.executors = {
@@ -473,6 +660,10 @@ class CCDispatcher:
             AITool.CODEX_CLI: CodexExecutor(),
         }
     
+    async def shutdown(self):
+        """Release the dispatcher's network resources"""
+        await self.syncwave.aclose()
+    
     def analyze_task(self, description: str, project_id: str = None) -> DispatchTask:
         """
         Analyze a task description and create DispatchTask.
@@ -487,30 +678,18 @@ class CCDispatcher:
         desc_lower = description.lower()
         
         # Determine task type
-        if any(word in desc_lower for word in ["document", "readme", "docs", "comment"]):
-            task.task_type = TaskType.DOCUMENTATION
-        elif any(word in desc_lower for word in ["test", "spec", "unit test"]):
-            task.task_type = TaskType.TESTING
-        elif any(word in desc_lower for word in ["bug", "fix", "error", "issue"]):
-            task.task_type = TaskType.DEBUGGING
-        elif any(word in desc_lower for word in ["architect", "design", "structure", "refactor major"]):
-            task.task_type = TaskType.ARCHITECTURE
-        elif any(word in desc_lower for word in ["review", "check", "audit"]):
-            task.task_type = TaskType.CODE_REVIEW
-        elif any(word in desc_lower for word in ["research", "analyze", "investigate"]):
-            task.task_type = TaskType.RESEARCH
-        else:
-            task.task_type = TaskType.CODE_GENERATION
+        task.task_type = next(
+            (task_type for task_type, pattern in _TASK_TYPE_PATTERNS
+             if pattern.search(desc_lower)),
+            TaskType.CODE_GENERATION,
+        )
         
         # Determine complexity
-        if any(word in desc_lower for word in ["simple", "basic", "quick", "small"]):
-            task.complexity = TaskComplexity.LOW
-        elif any(word in desc_lower for word in ["complex", "difficult", "major", "critical"]):
-            task.complexity = TaskComplexity.HIGH
-        elif any(word in desc_lower for word in ["trivial", "tiny", "minor"]):
-            task.complexity = TaskComplexity.TRIVIAL
-        else:
-            task.complexity = TaskComplexity.MEDIUM
+        task.complexity = next(
+            (complexity for complexity, pattern in _COMPLEXITY_PATTERNS
+             if pattern.search(desc_lower)),
+            TaskComplexity.MEDIUM,
+        )
         
         # Set project priority from registry
         task.project_priority = self._get_project_priority(project_id)
@@ -522,20 +701,7 @@ class CCDispatcher:
     
     def _get_project_priority(self, project_id: str) -> ProjectPriority:
         """Get project priority from Asset Registry"""
-        # Project priority mapping from registry
-        priorities = {
-            "nh": ProjectPriority.CRITICAL,
-            "nhmc": ProjectPriority.CRITICAL,
-            "sw": ProjectPriority.HIGH,
-            "sf": ProjectPriority.HIGH,
-            "toa": ProjectPriority.HIGH,
-            "pf": ProjectPriority.HIGH,
-            "fpr": ProjectPriority.MEDIUM,
-            "cn": ProjectPriority.LOW,
-            "us": ProjectPriority.LOW,
-            "cit": ProjectPriority.EXPERIMENTAL,
-        }
-        return priorities.get(project_id, ProjectPriority.MEDIUM)
+        return _PROJECT_PRIORITIES.get(project_id, ProjectPriority.MEDIUM)
     
     async def dispatch(self, task: DispatchTask) -> DispatchTask:
         """
@@ -549,7 +715,7 @@ class CCDispatcher:
         await self.syncwave.send_task_started(task)
         
         # Add to queue
-        self.task_queue.append(task)
+        self.task_queue[task.id] = task
         
         return task
     
@@ -586,8 +752,7 @@ class CCDispatcher:
                 await self.syncwave.send_task_failed(task)
         
         # Move to history
-        if task in self.task_queue:
-            self.task_queue.remove(task)
+        self.task_queue.pop(task.id, None)
         self.task_history.append(task)
         
         return task
@@ -595,16 +760,20 @@ class CCDispatcher:
     def _build_prompt(self, task: DispatchTask) -> str:
         """Build prompt for AI tool"""
         prompt_parts = [
-            f"Task: {task.description}",
-            f"Type: {task.task_type.value}",
-            f"Complexity: {task.complexity.value}",
+            f"Task: {task.description}\n"
+            f"Type: {task.task_type.value}\n"
+            f"Complexity: {task.complexity.value}"
         ]
         
         if task.project_id:
             prompt_parts.append(f"Project: {task.project_id}")
         
-        if task.files_involved:
-            prompt_parts.append(f"Files: {', '.join(task.files_involved)}")
+        files = task.files_involved
+        if files:
+            listed = ", ".join(files[:PROMPT_MAX_FILES])
+            if len(files) > PROMPT_MAX_FILES:
+                listed += f", ... (+{len(files) - PROMPT_MAX_FILES} more)"
+            prompt_parts.append(f"Files: {listed}")
         
         if task.working_directory:
             prompt_parts.append(f"Working directory: {task.working_directory}")
@@ -659,10 +828,17 @@ async def main():
     print("NH CC DISPATCHER - Task Routing Demo")
     print("="*70 + "\n")
     
-    for desc, project_id in tasks:
-        task = dispatcher.analyze_task(desc, project_id)
-        dispatcher.routing_engine.route(task)
-        
+    # Tasks are independent, so their notification/execution I/O overlaps;
+    # dispatch() routes each task exactly once
+    try:
+        results = await asyncio.gather(*(
+            dispatcher.dispatch_and_execute(desc, project_id)
+            for desc, project_id in tasks
+        ))
+    finally:
+        await dispatcher.shutdown()
+    
+    for (desc, project_id), task in zip(tasks, results, strict=True):
         print(f"📋 Task: {desc[:50]}...")
         print(f"   Project: {project_id} ({task.project_priority.value})")
         print(f"   Type: {task.task_type.value}")
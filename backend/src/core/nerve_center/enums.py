@@ -0,0 +1,27 @@
+"""
+NH Nerve Center - Shared Enums
+===============================
+
+Enums used by both the Asset Registry and the CC Dispatcher. Defined once
+here so values compare equal across the two modules.
+"""
+
+from enum import Enum
+
+
+class ProjectPriority(str, Enum):
+    """Project priority levels"""
+    CRITICAL = "critical"      # NH core, income-generating
+    HIGH = "high"              # Important for goals
+    MEDIUM = "medium"          # Nice to have
+    LOW = "low"                # Backburner
+    EXPERIMENTAL = "experimental"  # Learning/exploration
+
+
+class TaskComplexity(str, Enum):
+    """Task complexity for delegation"""
+    TRIVIAL = "trivial"        # Simple, repetitive
+    LOW = "low"                # Straightforward
+    MEDIUM = "medium"          # Some nuance required
+    HIGH = "high"              # Complex reasoning
+    CRITICAL = "critical"      # Mission-critical, needs best
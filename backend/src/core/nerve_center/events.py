@@ -6,12 +6,23 @@ Core event types and structures for real-time transparency.
 Every operation in NH emits events that can be tracked.
 """
 
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
-from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Deque
+from dataclasses import dataclass, field
 from uuid import uuid4
 import json
+import time
+
+from .codegen import to_dict_builder
+
+# orjson is optional; NHEvent.to_json falls back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ==========================================================================
@@ -182,11 +193,34 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
+# Value -> member lookups for from_dict; plain dict hits skip Enum.__call__
+_CATEGORY_MAP = {member.value: member for member in EventCategory}
+_EVENT_TYPE_MAP = {member.value: member for member in EventType}
+_SEVERITY_MAP = {member.value: member for member in Severity}
+
+
 # ==========================================================================
 # Core Event Structure
 # ==========================================================================
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Same string as datetime.utcnow().isoformat() for a time.time_ns() stamp"""
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+def _iso_to_ns(value: str) -> int:
+    """Inverse of _ns_to_iso; offset-aware strings are converted to UTC"""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+@dataclass(slots=True, eq=False)
 class NHEvent:
     """
     Base event structure for all NH operations.
@@ -194,7 +228,7 @@ class NHEvent:
     """
     # Identity
     id: str = field(default_factory=lambda: str(uuid4()))
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)  # formatted on demand
     
     # Classification
     category: EventCategory = EventCategory.SYSTEM
@@ -224,31 +258,73 @@ class NHEvent:
     tokens_output: Optional[int] = None
     cost_usd: Optional[float] = None
     
+    @property
+    def timestamp(self) -> str:
+        """Creation time as a naive UTC ISO-8601 string"""
+        return _ns_to_iso(self.timestamp_ns)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        """
+        Convert to dictionary for JSON serialization.
+        Shallow: `details` is shared with the event, not copied.
+        """
+        data = {"id": self.id, "timestamp": self.timestamp}
+        data.update(
+            (name, value)
+            for name in _EVENT_BODY_FIELDS
+            if (value := getattr(self, name)) is not None
+        )
+        return data
     
     def to_json(self) -> str:
         """Convert to JSON string"""
+        # orjson encodes the str enums natively, so no default= is needed
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode()
         return json.dumps(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NHEvent':
         """Create from dictionary"""
-        # Convert string enums back
+        if 'timestamp' in data:
+            data['timestamp_ns'] = _iso_to_ns(data.pop('timestamp'))
+        # Convert string enums back; unknown values still raise ValueError
         if 'category' in data:
-            data['category'] = EventCategory(data['category'])
+            value = data['category']
+            data['category'] = _CATEGORY_MAP.get(value) or EventCategory(value)
         if 'event_type' in data:
-            data['event_type'] = EventType(data['event_type'])
+            value = data['event_type']
+            data['event_type'] = _EVENT_TYPE_MAP.get(value) or EventType(value)
         if 'severity' in data:
-            data['severity'] = Severity(data['severity'])
+            value = data['severity']
+            data['severity'] = _SEVERITY_MAP.get(value) or Severity(value)
         return cls(**data)
 
 
+# Everything to_dict emits after the leading id/timestamp pair
+_EVENT_BODY_FIELDS = tuple(
+    name for name in NHEvent.__dataclass_fields__
+    if name not in ("id", "timestamp_ns")
+)
+
+
 # ==========================================================================
 # Specialized Event Builders
 # ==========================================================================
 
+_FILE_EVENT_TYPES = MappingProxyType({
+    "read": EventType.FILE_READ,
+    "write": EventType.FILE_WRITE,
+    "create": EventType.FILE_CREATE,
+    "delete": EventType.FILE_DELETE,
+})
+
+
+def _preview(text: str, limit: int) -> str:
+    """First `limit` characters of text, with "..." if anything was cut"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 class EventBuilder:
     """Factory for creating specific event types"""
     
@@ -326,15 +402,9 @@ class EventBuilder:
         task_id: str = None,
     ) -> NHEvent:
         """File system operation"""
-        event_types = {
-            "read": EventType.FILE_READ,
-            "write": EventType.FILE_WRITE,
-            "create": EventType.FILE_CREATE,
-            "delete": EventType.FILE_DELETE,
-        }
         return NHEvent(
             category=EventCategory.FILE,
-            event_type=event_types.get(operation, EventType.FILE_READ),
+            event_type=_FILE_EVENT_TYPES.get(operation, EventType.FILE_READ),
             session_id=session_id,
             task_id=task_id,
             message=f"{operation.upper()}: {file_path}",
@@ -362,7 +432,7 @@ class EventBuilder:
             message=f"LLM Request to {model}",
             details={
                 "model": model,
-                "prompt_preview": prompt_preview[:200] + "..." if len(prompt_preview) > 200 else prompt_preview,
+                "prompt_preview": _preview(prompt_preview, 200),
                 "max_tokens": max_tokens,
             },
         )
@@ -825,6 +895,32 @@ class EventBuilder:
             },
         )
 
+    @staticmethod
+    def cc_output_lines(
+        cc_session_id: str,
+        session_name: str,
+        first_line_number: int,
+        lines: List[str],
+        is_error: bool = False,
+    ) -> NHEvent:
+        """Batch of consecutive CC session output lines"""
+        last = lines[-1] if lines else ""
+        return NHEvent(
+            category=EventCategory.CC_SESSION,
+            event_type=EventType.CC_OUTPUT_LINE,
+            severity=Severity.ERROR if is_error else Severity.DEBUG,
+            session_id=cc_session_id,
+            message=last[:200],
+            details={
+                "cc_session_id": cc_session_id,
+                "session_name": session_name,
+                "line_number": first_line_number,
+                "lines": lines,
+                "count": len(lines),
+                "is_error": is_error,
+            },
+        )
+
     @staticmethod
     def cc_heartbeat(
         cc_session_id: str,
@@ -893,7 +989,28 @@ class EventBuilder:
 # Event Aggregation for UI
 # ==========================================================================
 
-@dataclass
+# Events retained per session/task/agent; older ones are dropped first
+STATE_EVENT_LIMIT = 2000
+
+
+def _event_buffer() -> Deque[NHEvent]:
+    return deque(maxlen=STATE_EVENT_LIMIT)
+
+
+# Fields serialized element-wise through their items' own to_dict
+_NESTED_STATE_FIELDS = frozenset({"events", "sub_tasks"})
+
+
+def _state_field_value(f: Any) -> Optional[str]:
+    # Event buffers and sub-tasks become lists of dicts
+    return "[item.to_dict() for item in {}]" if f.name in _NESTED_STATE_FIELDS else None
+
+
+# Per state class: to_dict as a single dict display of attribute loads
+_state_to_dict_fn = to_dict_builder(nested=_state_field_value)
+
+
+@dataclass(slots=True)
 class TaskState:
     """Aggregated state for a single task"""
     id: str
@@ -905,11 +1022,15 @@ class TaskState:
     completed_at: Optional[str] = None
     duration_ms: Optional[float] = None
     error: Optional[str] = None
-    events: List[NHEvent] = field(default_factory=list)
+    events: Deque[NHEvent] = field(default_factory=_event_buffer)
     sub_tasks: List['TaskState'] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize with nested events and sub-tasks as plain dicts"""
+        return _state_to_dict_fn(type(self))(self)
 
 
-@dataclass  
+@dataclass(slots=True)
 class AgentState:
     """Aggregated state for an agent"""
     id: str
@@ -922,10 +1043,14 @@ class AgentState:
     tasks_failed: int = 0
     total_tokens: int = 0
     total_cost_usd: float = 0
-    events: List[NHEvent] = field(default_factory=list)
+    events: Deque[NHEvent] = field(default_factory=_event_buffer)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize with nested events as plain dicts"""
+        return _state_to_dict_fn(type(self))(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """Complete state for a session/job"""
     id: str
@@ -946,8 +1071,8 @@ class SessionState:
     # Tasks (hierarchical)
     root_tasks: List[TaskState] = field(default_factory=list)
     
-    # All events (for log view)
-    events: List[NHEvent] = field(default_factory=list)
+    # Most recent events (for log view)
+    events: Deque[NHEvent] = field(default_factory=_event_buffer)
     
     # Costs
     total_tokens_input: int = 0
@@ -971,8 +1096,8 @@ class SessionState:
             "completed_tasks": self.completed_tasks,
             "failed_tasks": self.failed_tasks,
             "progress_percent": self.progress_percent,
-            "agents": {k: asdict(v) for k, v in self.agents.items()},
-            "root_tasks": [asdict(t) for t in self.root_tasks],
+            "agents": {k: v.to_dict() for k, v in self.agents.items()},
+            "root_tasks": [t.to_dict() for t in self.root_tasks],
             "total_tokens_input": self.total_tokens_input,
             "total_tokens_output": self.total_tokens_output,
             "total_cost_usd": self.total_cost_usd,
@@ -0,0 +1,19 @@
+"""
+NH Nerve Center - Process-Local IDs
+====================================
+
+Log entries, tasks, phases, agents and recommendations only need ids that
+are unique within this process (UI updates, WebSocket events), so a random
+per-process prefix plus a counter replaces uuid4 and its urandom read.
+"""
+
+import itertools
+import secrets
+
+_ID_PREFIX = secrets.token_hex(4)
+_ID_COUNTER = itertools.count()
+
+
+def next_id() -> str:
+    """Next process-unique id: 8 hex prefix chars + 12 hex counter digits"""
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):012x}"
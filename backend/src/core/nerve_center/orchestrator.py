@@ -10,7 +10,6 @@ import asyncio
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Callable, Awaitable
 from dataclasses import dataclass, field
-from uuid import uuid4
 from enum import Enum
 import logging
 
@@ -19,10 +18,10 @@ from .events import (
     EventBuilder, SessionState, TaskState, AgentState
 )
 from .websocket_hub import get_connection_manager, ConnectionManager
+from .ids import next_id
 
 logger = logging.getLogger(__name__)
 
-
 # ==========================================================================
 # Agent Definitions
 # ==========================================================================
@@ -36,10 +35,10 @@ class AgentRole(str, Enum):
     EXECUTOR = "executor"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an agent"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=next_id)
     name: str = ""
     role: AgentRole = AgentRole.ANALYZER
     model: str = "claude-3-opus"
@@ -53,10 +52,10 @@ class AgentConfig:
 # Task Definitions
 # ==========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TaskDefinition:
     """Definition of a task to be executed"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=next_id)
     name: str = ""
     description: str = ""
     agent_role: AgentRole = AgentRole.ANALYZER
@@ -0,0 +1,32 @@
+"""
+NH Nerve Center - Slotted Dataclass Helpers
+============================================
+
+Used by the Analyzer Engine and the Asset Registry to keep derived counts
+and indexes in step with the dataclass fields they are built from.
+"""
+
+from typing import Any, Callable
+
+
+def watch_slot(cls: type, name: str, on_set: Callable[[Any, Any, Any], Any]) -> None:
+    """
+    Turn a slotted dataclass field into a property over its own slot.
+
+    on_set(obj, old, new) runs on every assignment (old is None for the
+    one made by __init__) and returns the value to store. fields(),
+    asdict() and the generated __init__/__repr__ are unaffected.
+    """
+    slot = getattr(cls, name)
+
+    def fget(obj):
+        return slot.__get__(obj, cls)
+
+    def fset(obj, value):
+        try:
+            old = slot.__get__(obj, cls)
+        except AttributeError:
+            old = None
+        slot.__set__(obj, on_set(obj, old, value))
+
+    setattr(cls, name, property(fget, fset))
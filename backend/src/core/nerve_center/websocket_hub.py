@@ -8,8 +8,9 @@ Clients connect to receive live updates on all NH operations.
 
 import asyncio
 import json
+from collections import deque
 from datetime import datetime
-from typing import Dict, Set, Optional, Callable, Any, List
+from typing import Dict, Set, Optional, Callable, Any, Deque, Sequence
 from dataclasses import dataclass, field
 from uuid import uuid4
 from enum import Enum
@@ -25,6 +26,12 @@ from .events import (
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; WSMessage falls back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ==========================================================================
 # WebSocket Message Types
@@ -40,6 +47,7 @@ class WSMessageType(str, Enum):
     
     # Server -> Client
     EVENT = "event"
+    EVENT_BATCH = "event_batch"  # payload is a list of events, oldest first
     STATE = "state"
     STATE_DELTA = "state_delta"
     PONG = "pong"
@@ -54,18 +62,27 @@ class WSMessage:
     payload: Any
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     message_id: str = field(default_factory=lambda: str(uuid4()))
+    _encoded: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_json(self) -> str:
-        return json.dumps({
-            "type": self.type.value,
-            "payload": self.payload,
-            "timestamp": self.timestamp,
-            "message_id": self.message_id,
-        })
+        # Broadcasts send one message to every client; encode it only once
+        if self._encoded is None:
+            data = {
+                "type": self.type.value,
+                "payload": self.payload,
+                "timestamp": self.timestamp,
+                "message_id": self.message_id,
+            }
+            if orjson is not None:
+                self._encoded = orjson.dumps(data).decode()
+            else:
+                self._encoded = json.dumps(data)
+        return self._encoded
     
     @classmethod
     def from_json(cls, data: str) -> 'WSMessage':
-        parsed = json.loads(data)
+        # orjson's JSONDecodeError subclasses json's, so callers catch either
+        parsed = orjson.loads(data) if orjson is not None else json.loads(data)
         return cls(
             type=WSMessageType(parsed["type"]),
             payload=parsed.get("payload"),
@@ -78,6 +95,16 @@ class WSMessage:
 # Connection Manager
 # ==========================================================================
 
+# Events are broadcast in batches: at most EVENT_FLUSH_INTERVAL seconds after
+# they are emitted, or as soon as EVENT_FLUSH_BATCH are pending. Errors and
+# critical events skip the wait.
+EVENT_FLUSH_INTERVAL = 0.02
+EVENT_FLUSH_BATCH = 64
+EVENT_QUEUE_SIZE = 4096
+
+_URGENT_SEVERITIES = frozenset({Severity.ERROR, Severity.CRITICAL})
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(Severity)}
+
 @dataclass
 class ClientConnection:
     """Represents a connected WebSocket client"""
@@ -110,9 +137,14 @@ class ConnectionManager:
         
         self.connections: Dict[str, ClientConnection] = {}
         self.sessions: Dict[str, SessionState] = {}
-        self.event_history: List[NHEvent] = []
         self.max_history: int = 10000
+        self.event_history: Deque[NHEvent] = deque(maxlen=self.max_history)
         self._lock = asyncio.Lock()
+        
+        # Broadcast batching
+        self._pending_events: Deque[NHEvent] = deque(maxlen=EVENT_QUEUE_SIZE)
+        self._dirty_sessions: Dict[str, None] = {}  # ordered set
+        self._flush_task: Optional[asyncio.Task] = None
         self._initialized = True
     
     async def connect(self, websocket: WebSocket) -> str:
@@ -211,28 +243,61 @@ class ConnectionManager:
     
     async def broadcast_event(self, event: NHEvent):
         """Broadcast event to all subscribed clients"""
-        message = WSMessage(
-            type=WSMessageType.EVENT,
-            payload=event.to_dict()
-        )
+        await self.broadcast_events([event])
+    
+    async def broadcast_events(self, events: Sequence[NHEvent]):
+        """
+        Broadcast events to subscribed clients, one message per client.
+        A client that matches a single event gets a plain EVENT message.
+        """
+        # Events are serialized on first use; ones no client admits never are
+        payloads: Dict[int, Dict[str, Any]] = {}
+        
+        def payload(i: int) -> Dict[str, Any]:
+            if i not in payloads:
+                payloads[i] = events[i].to_dict()
+            return payloads[i]
+        
+        # Clients with the same filters receive the same (already encoded) message
+        messages: Dict[tuple, WSMessage] = {}
         
         for client_id, connection in list(self.connections.items()):
             if not connection.is_active:
                 continue
             
-            # Check subscription filters
-            if event.session_id and event.session_id not in connection.subscribed_sessions:
-                # Client not subscribed to this session, skip unless subscribed to all
-                if connection.subscribed_sessions:  # Has specific subscriptions
-                    continue
-            
-            # Check severity filter
-            severity_order = [Severity.DEBUG, Severity.INFO, Severity.WARNING, Severity.ERROR, Severity.CRITICAL]
-            if severity_order.index(event.severity) < severity_order.index(connection.filter_severity):
+            selected = tuple(
+                i for i, event in enumerate(events)
+                if self._wants_event(connection, event)
+            )
+            if not selected:
                 continue
             
+            message = messages.get(selected)
+            if message is None:
+                if len(selected) == 1:
+                    message = WSMessage(
+                        type=WSMessageType.EVENT,
+                        payload=payload(selected[0]),
+                    )
+                else:
+                    message = WSMessage(
+                        type=WSMessageType.EVENT_BATCH,
+                        payload=[payload(i) for i in selected],
+                    )
+                messages[selected] = message
+            
             await self._send_to_client(client_id, message)
     
+    @staticmethod
+    def _wants_event(connection: ClientConnection, event: NHEvent) -> bool:
+        """Whether the client's subscription and severity filters admit the event"""
+        if event.session_id and event.session_id not in connection.subscribed_sessions:
+            # Client not subscribed to this session, skip unless subscribed to all
+            if connection.subscribed_sessions:  # Has specific subscriptions
+                return False
+        
+        return _SEVERITY_RANK[event.severity] >= _SEVERITY_RANK[connection.filter_severity]
+    
     async def broadcast_state(self, session_id: str):
         """Broadcast full state update for a session"""
         if session_id not in self.sessions:
@@ -284,17 +349,42 @@ class ConnectionManager:
         Emit event to all subscribers and update state.
         This is the main entry point for all NH operations.
         """
-        # Store in history
+        # Store in history (the deque drops the oldest past max_history)
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history = self.event_history[-self.max_history:]
         
         # Update session state based on event
         if event.session_id:
             await self._update_state_from_event(event)
         
-        # Broadcast to clients
-        await self.broadcast_event(event)
+        # Queue for the next broadcast batch
+        self._pending_events.append(event)
+        if (event.severity in _URGENT_SEVERITIES
+                or len(self._pending_events) >= EVENT_FLUSH_BATCH):
+            await self.flush_events()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def flush_events(self):
+        """Broadcast queued events, plus the state of each session they touched"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        
+        events = list(self._pending_events)
+        self._pending_events.clear()
+        session_ids = list(self._dirty_sessions)
+        self._dirty_sessions.clear()
+        
+        for session_id in session_ids:
+            await self.broadcast_state(session_id)
+        if events:
+            await self.broadcast_events(events)
+    
+    async def _flush_later(self):
+        await asyncio.sleep(EVENT_FLUSH_INTERVAL)
+        # Detach first so flush_events() doesn't cancel the task it runs in
+        self._flush_task = None
+        await self.flush_events()
     
     async def _update_state_from_event(self, event: NHEvent):
         """Update session state based on event"""
@@ -340,8 +430,8 @@ class ConnectionManager:
             if path and path not in session.files_created:
                 session.files_created.append(path)
         
-        # Broadcast updated state
-        await self.broadcast_state(event.session_id)
+        # Broadcast updated state with the next event batch
+        self._dirty_sessions[event.session_id] = None
 
 
 # ==========================================================================
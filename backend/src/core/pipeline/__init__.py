@@ -21,7 +21,11 @@ Components:
 - CCSessionManager: Claude Code session visibility & reliability (EPOCH 8)
 """
 
-from src.core.pipeline.orchestrator import PipelineOrchestrator
+from src.core.pipeline.orchestrator import (
+    PipelineOrchestrator,
+    PIPELINE_RUN_FULL_LOAD,
+    bulk_transition,
+)
 from src.core.pipeline.handoff import HandoffTokenGenerator
 from src.core.pipeline.neural_ralph import NeuralRalph
 from src.core.pipeline.health_inspector import HealthInspector
@@ -33,6 +37,8 @@ from src.core.pipeline.cc_session_manager import CCSessionManager
 
 __all__ = [
     "PipelineOrchestrator",
+    "PIPELINE_RUN_FULL_LOAD",
+    "bulk_transition",
     "HandoffTokenGenerator",
     "NeuralRalph",
     "HealthInspector",
@@ -336,6 +336,83 @@ class CCSessionState:
     heartbeat_timeout_seconds: int = 60
 
 
+# ==========================================================================
+# CC Output Batching
+# ==========================================================================
+
+class CCOutputBatcher:
+    """
+    Coalesces a session's output lines into one CC_OUTPUT_LINE event.
+
+    A batch is emitted once it holds max_lines lines, or max_delay seconds
+    after its first line arrived. The delay is a timer task started per
+    batch, so adding a line never reads the clock. Error lines are never
+    batched: pending output is flushed and each error goes out as its own
+    ERROR event.
+    """
+
+    def __init__(
+        self,
+        emit_event: Callable[[NHEvent], Any],
+        cc_session_id: str,
+        session_name: str,
+        max_lines: int = 64,
+        max_delay: float = 0.05,
+    ):
+        self.emit_event = emit_event
+        self.cc_session_id = cc_session_id
+        self.session_name = session_name
+        self.max_lines = max_lines
+        self.max_delay = max_delay
+
+        self._lines: List[str] = []
+        self._first_line_number = 0
+        self._timer: Optional[asyncio.Task] = None
+
+    async def add(self, line_number: int, content: str, is_error: bool = False) -> None:
+        """Buffer one output line, emitting the batch if it is full."""
+        if is_error:
+            await self.flush()
+            await self._emit(line_number, [content], is_error=True)
+            return
+
+        if not self._lines:
+            self._first_line_number = line_number
+            self._timer = asyncio.create_task(self._flush_later())
+
+        self._lines.append(content)
+
+        if len(self._lines) >= self.max_lines:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Emit whatever is buffered as a single event."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._lines:
+            return
+
+        lines, self._lines = self._lines, []
+        await self._emit(self._first_line_number, lines)
+
+    async def _emit(self, first_line_number: int, lines: List[str], is_error: bool = False) -> None:
+        await self.emit_event(EventBuilder.cc_output_lines(
+            cc_session_id=self.cc_session_id,
+            session_name=self.session_name,
+            first_line_number=first_line_number,
+            lines=lines,
+            is_error=is_error,
+        ))
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        # Detach first so flush() doesn't cancel the task it is running in
+        self._timer = None
+        await self.flush()
+
+
 # ==========================================================================
 # CC Session Manager
 # ==========================================================================
@@ -612,6 +689,8 @@ class CCSessionManager:
         if not state:
             return
 
+        batcher = CCOutputBatcher(self.emit_event, session_id, state.session_name)
+
         while state.status == CCSessionStatus.RUNNING:
             try:
                 # Read new output
@@ -636,18 +715,13 @@ class CCSessionManager:
                             for pat in ERROR_PATTERNS
                         )
 
-                        # Emit output event
-                        await self.emit_event(EventBuilder.cc_output_line(
-                            cc_session_id=session_id,
-                            session_name=state.session_name,
-                            line_number=state.last_output_line,
-                            content=line,
-                            is_error=is_error,
-                        ))
+                        # Queue output for the next batched event
+                        await batcher.add(state.last_output_line, line, is_error)
 
                         # Check for completion
                         if self._detect_completion(line):
                             state.status = CCSessionStatus.COMPLETED
+                            await batcher.flush()
                             await self._handle_completion(state)
                             return
 
@@ -657,6 +731,8 @@ class CCSessionManager:
                 logger.error("Output streaming error", error=str(e))
                 await asyncio.sleep(2)
 
+        await batcher.flush()
+
     def _detect_completion(self, line: str) -> bool:
         """Check if line indicates task completion."""
         for pattern in COMPLETION_PATTERNS:
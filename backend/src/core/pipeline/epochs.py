@@ -10,6 +10,7 @@ from typing import Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.core.models import Epoch, EpochStatus
 
@@ -246,11 +247,19 @@ class EpochManager:
             for feature in self.FEATURE_DESCRIPTIONS.keys()
         ]
 
-    async def get_epoch_history(self) -> list[Epoch]:
-        """Get all epochs ordered by start date."""
-        result = await self.db.execute(
-            select(Epoch).order_by(Epoch.started_at.desc())
-        )
+    async def get_epoch_history(self, include_runs: bool = False) -> list[Epoch]:
+        """
+        Get all epochs ordered by start date.
+
+        Args:
+            include_runs: Also load each epoch's pipeline runs (one extra
+                SELECT for all epochs). Leave off for name/status listings.
+        """
+        query = select(Epoch).order_by(Epoch.started_at.desc())
+        if include_runs:
+            query = query.options(selectinload(Epoch.pipeline_runs))
+
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
     def get_epoch_definition(self, epoch_name: str) -> Optional[dict]:
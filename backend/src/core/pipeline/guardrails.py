@@ -8,7 +8,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +17,7 @@ from src.core.models import (
     GuardrailViolation,
     PipelineStage,
     EscalationLevel,
+    uuid7,
 )
 
 logger = logging.getLogger(__name__)
@@ -368,7 +369,7 @@ class GuardrailsEngine:
     ):
         """Log a guardrail violation."""
         violation = GuardrailViolation(
-            id=uuid4(),
+            id=uuid7(),
             layer=result.layer,
             rule_name=result.rule,
             attempted_action=context.get("action", "unknown"),
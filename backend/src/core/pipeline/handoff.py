@@ -5,19 +5,25 @@ Creates cryptographically signed tokens with trust scoring.
 """
 
 import hashlib
+import hmac
 import json
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models import HandoffToken, PipelineStage
+from src.core.models import HandoffToken, PipelineStage, uuid7
 
 logger = logging.getLogger(__name__)
 
+# Shared canonical encoder for signing. json.dumps(..., sort_keys=True)
+# builds a fresh JSONEncoder on every call; the output is byte-identical, so
+# signatures on existing tokens still verify.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True)
+
 
 class HandoffTokenGenerator:
     """
@@ -80,7 +86,7 @@ class HandoffTokenGenerator:
         )
 
         token = HandoffToken(
-            id=uuid4(),
+            id=uuid7(),
             pipeline_run_id=pipeline_run_id,
             from_stage=from_stage,
             to_stage=to_stage,
@@ -218,12 +224,12 @@ class HandoffTokenGenerator:
             "from_stage": from_stage,
             "to_stage": to_stage,
             "trust_score": round(trust_score, 2),
-            "verification": json.dumps(verification, sort_keys=True),
+            "verification": _CANONICAL_JSON.encode(verification),
             "secret": self.secret_key,
         }
 
         # Serialize and hash
-        payload_str = json.dumps(payload, sort_keys=True)
+        payload_str = _CANONICAL_JSON.encode(payload)
         signature = hashlib.sha256(payload_str.encode()).hexdigest()
 
         return signature
@@ -246,7 +252,7 @@ class HandoffTokenGenerator:
             verification=token.verification,
         )
 
-        return token.signature == expected_signature
+        return hmac.compare_digest(token.signature, expected_signature)
 
     async def invalidate_token(self, token: HandoffToken, reason: str):
         """
@@ -264,18 +270,23 @@ class HandoffTokenGenerator:
     async def get_token(self, token_id: UUID) -> Optional[HandoffToken]:
         """Get a handoff token by ID."""
         from sqlalchemy import select
+        from sqlalchemy.orm import undefer
 
         result = await self.db.execute(
-            select(HandoffToken).where(HandoffToken.id == token_id)
+            select(HandoffToken)
+            .options(undefer(HandoffToken.verification))
+            .where(HandoffToken.id == token_id)
         )
         return result.scalar_one_or_none()
 
     async def get_tokens_for_run(self, pipeline_run_id: UUID) -> list[HandoffToken]:
         """Get all handoff tokens for a pipeline run."""
         from sqlalchemy import select
+        from sqlalchemy.orm import undefer
 
         result = await self.db.execute(
             select(HandoffToken)
+            .options(undefer(HandoffToken.verification))
             .where(HandoffToken.pipeline_run_id == pipeline_run_id)
             .order_by(HandoffToken.created_at)
         )
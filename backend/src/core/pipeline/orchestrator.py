@@ -6,11 +6,14 @@ Manages task flow through pipeline stages with handoff verification.
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID
 
+from sqlalchemy import case, func, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.core.models import (
     PipelineRun,
@@ -19,10 +22,88 @@ from src.core.models import (
     StageExecution,
     EscalationLevel,
     CCSessionStatus,
+    uuid7,
 )
 
 logger = logging.getLogger(__name__)
 
+# Loader options for detail views that need every child collection of a run.
+# List/status queries should not use these.
+PIPELINE_RUN_FULL_LOAD = (
+    selectinload(PipelineRun.stage_executions),
+    selectinload(PipelineRun.handoff_tokens),
+    selectinload(PipelineRun.resource_allocations),
+)
+
+# Max rows per bulk UPDATE statement
+BULK_TRANSITION_BATCH_SIZE = 1000
+
+# Run statuses bulk_transition() never rewrites, and which stamp completed_at
+TERMINAL_RUN_STATUSES = (
+    PipelineRunStatus.COMPLETED,
+    PipelineRunStatus.FAILED,
+    PipelineRunStatus.CANCELLED,
+)
+
+
+async def bulk_transition(
+    db: AsyncSession,
+    transitions: Mapping[UUID, PipelineStage],
+    status: Optional[PipelineRunStatus] = None,
+) -> int:
+    """
+    Move many pipeline runs to new stages with one UPDATE per batch.
+
+    Uniform transitions become ``SET current_stage = :stage WHERE id IN (...)``;
+    mixed ones use ``SET current_stage = CASE id WHEN ... END``. Runs that
+    already finished (completed, failed or cancelled) are left untouched.
+    This bypasses the unit of work, so already-loaded PipelineRun instances
+    are stale until refreshed, and it does not release resources - callers
+    moving runs to a terminal status must do that themselves.
+
+    Args:
+        db: Database session (caller commits)
+        transitions: Run ID -> target stage
+        status: Optional run status to set on every affected run; a
+            terminal status also sets completed_at
+
+    Returns:
+        Number of rows updated (runs already finished are not counted)
+    """
+    items = list(transitions.items())
+    updated = 0
+
+    for start in range(0, len(items), BULK_TRANSITION_BATCH_SIZE):
+        batch = dict(items[start:start + BULK_TRANSITION_BATCH_SIZE])
+        stages = set(batch.values())
+
+        if len(stages) == 1:
+            stage_value = stages.pop()
+        else:
+            # Bind through the column type so values are stored, not names
+            stage_type = PipelineRun.__table__.c.current_stage.type
+            stage_value = case(
+                {run_id: literal(stage, stage_type) for run_id, stage in batch.items()},
+                value=PipelineRun.id,
+            )
+
+        values = {"current_stage": stage_value, "updated_at": func.now()}
+        if status is not None:
+            values["status"] = status
+            if status in TERMINAL_RUN_STATUSES:
+                values["completed_at"] = func.now()
+
+        result = await db.execute(
+            update(PipelineRun)
+            .where(PipelineRun.id.in_(batch.keys()))
+            .where(PipelineRun.status.not_in(TERMINAL_RUN_STATUSES))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        updated += result.rowcount
+
+    return updated
+
 
 class PipelineOrchestrator:
     """
@@ -103,7 +184,7 @@ class PipelineOrchestrator:
             initial_level = EscalationLevel.SONNET
 
         run = PipelineRun(
-            id=uuid4(),
+            id=uuid7(),
             task_id=task_id,
             task_title=task_title,
             task_description=task_description,
@@ -213,7 +294,7 @@ class PipelineOrchestrator:
 
         # Create stage execution record
         execution = StageExecution(
-            id=uuid4(),
+            id=uuid7(),
             pipeline_run_id=pipeline_run.id,
             stage=stage,
             status="running",
@@ -508,13 +589,21 @@ Please implement this task. When done, summarize what you've accomplished.
 
         await self.resource_manager.release_all(pipeline_run.task_id)
 
-    async def get_run(self, run_id: str) -> Optional[PipelineRun]:
-        """Get a pipeline run by ID."""
+    async def get_run(self, run_id: str, full: bool = False) -> Optional[PipelineRun]:
+        """
+        Get a pipeline run by ID.
+
+        Args:
+            run_id: Pipeline run ID
+            full: Also load stage executions, handoff tokens and allocations
+        """
         from sqlalchemy import select
 
-        result = await self.db.execute(
-            select(PipelineRun).where(PipelineRun.id == run_id)
-        )
+        query = select(PipelineRun).where(PipelineRun.id == run_id)
+        if full:
+            query = query.options(*PIPELINE_RUN_FULL_LOAD)
+
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def pause(self, pipeline_run: PipelineRun):
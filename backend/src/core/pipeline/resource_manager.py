@@ -9,12 +9,12 @@ import logging
 import socket
 from datetime import datetime, timezone
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models import ResourceAllocation, ResourceType
+from src.core.models import ResourceAllocation, ResourceType, uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -253,7 +253,7 @@ class ResourceManager:
     ) -> int:
         """Create a new port allocation record."""
         allocation = ResourceAllocation(
-            id=uuid4(),
+            id=uuid7(),
             task_id=task_id,
             resource_type=resource_type,
             value=port,
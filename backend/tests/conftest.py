@@ -13,8 +13,10 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.pool import StaticPool
 
 from src.api.main import app
@@ -31,13 +33,20 @@ from src.api.deps import create_access_token
 # Use in-memory SQLite for tests (fast)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw) -> str:
+    """Models use the PostgreSQL UUID type; SQLite stores it as hex text."""
+    return "CHAR(32)"
+
+
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 
-TestingSessionLocal = sessionmaker(
+TestingSessionLocal = async_sessionmaker(
     bind=test_engine,
     class_=AsyncSession,
     expire_on_commit=False,
@@ -55,6 +64,8 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """Create event loop for async tests."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    # aiosqlite's worker thread would otherwise keep the interpreter alive
+    loop.run_until_complete(test_engine.dispose())
     loop.close()
 
 
@@ -96,6 +107,27 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_counter() -> Generator[list[str], None, None]:
+    """
+    Record every SQL statement executed against the test engine.
+
+    Usage:
+        async def test_x(client, query_counter):
+            query_counter.clear()
+            await client.get(...)
+            assert len(query_counter) <= 1
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
 # ==========================================================================
 # User Fixtures
 # ==========================================================================
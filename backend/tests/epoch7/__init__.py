@@ -0,0 +1,6 @@
+"""
+Epoch 7 - Pipeline Orchestrator Tests
+======================================
+
+ACTIVE - Currently being implemented.
+"""
@@ -0,0 +1,278 @@
+"""
+NH Mission Control - Epoch 7: Pipeline Orchestrator Tests
+==========================================================
+
+EPOCH 7 - ACTIVE
+
+Read-path query budgets for the pipeline orchestrator endpoints.
+List endpoints must not fan out into per-row relationship loads.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import (
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineStage,
+    StageExecution,
+)
+from src.core.pipeline import orchestrator
+from src.core.pipeline.orchestrator import bulk_transition
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+@pytest.fixture
+async def pipeline_runs(db_session: AsyncSession) -> list[PipelineRun]:
+    """Create pipeline runs, each with a couple of stage executions."""
+    runs = []
+
+    for i in range(5):
+        run = PipelineRun(
+            id=uuid4(),
+            task_id=f"task-{i}",
+            task_title=f"Task {i}",
+            current_stage=PipelineStage.TESTING,
+            status=PipelineRunStatus.RUNNING,
+        )
+        db_session.add(run)
+        runs.append(run)
+
+        for stage in (PipelineStage.QUEUED, PipelineStage.DEVELOPING):
+            db_session.add(StageExecution(
+                id=uuid4(),
+                pipeline_run_id=run.id,
+                stage=stage,
+                status="passed",
+                output={"tests_passed": 3},
+            ))
+
+    await db_session.commit()
+    return runs
+
+
+# ==========================================================================
+# Query Budget Tests
+# ==========================================================================
+
+class TestReadPathQueryBudget:
+    """List endpoints issue a bounded number of queries."""
+
+    async def test_list_runs_single_query(
+        self,
+        client: AsyncClient,
+        pipeline_runs: list[PipelineRun],
+        query_counter: list[str],
+    ):
+        """Listing runs does not load stage executions/tokens/allocations."""
+        query_counter.clear()
+
+        response = await client.get("/api/v1/pipeline/runs")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 5
+        assert len(query_counter) <= 1
+
+    async def test_list_stages_single_query(
+        self,
+        client: AsyncClient,
+        pipeline_runs: list[PipelineRun],
+        query_counter: list[str],
+    ):
+        """Stage listing loads the deferred output in the same query."""
+        query_counter.clear()
+
+        response = await client.get(f"/api/v1/pipeline/runs/{pipeline_runs[0].id}/stages")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert data[0]["output"] == {"tests_passed": 3}
+        assert data[0]["tests_passed"] == 3
+        assert len(query_counter) <= 1
+
+
+# ==========================================================================
+# Promoted Metric Tests
+# ==========================================================================
+
+class TestPromotedMetrics:
+    """Generated metric columns never reject a malformed output blob."""
+
+    @pytest.mark.parametrize(
+        ("output", "expected"),
+        [
+            (
+                {"tests_passed": 3, "lint_errors": 0, "health_score": 87.5},
+                (3, 0, Decimal("87.50")),
+            ),
+            (
+                {"tests_passed": 3.0, "lint_errors": "n/a", "health_score": 150},
+                (None, None, None),
+            ),
+            ({"health_score": -1}, (None, None, None)),
+            (None, (None, None, None)),
+        ],
+    )
+    async def test_metrics_derived_from_output(
+        self,
+        db_session: AsyncSession,
+        output: dict | None,
+        expected: tuple,
+    ):
+        run = PipelineRun(id=uuid4(), task_id="task-m", task_title="Metrics")
+        execution = StageExecution(
+            id=uuid4(),
+            pipeline_run_id=run.id,
+            stage=PipelineStage.TESTING,
+            status="passed",
+            output=output,
+        )
+        db_session.add_all([run, execution])
+        await db_session.commit()
+
+        assert (
+            execution.tests_passed,
+            execution.lint_errors,
+            execution.health_score,
+        ) == expected
+
+
+# ==========================================================================
+# Bulk Transition Tests
+# ==========================================================================
+
+async def _load_runs(db_session: AsyncSession, runs: list[PipelineRun]) -> list[PipelineRun]:
+    """Re-read runs after a bulk UPDATE, which bypasses the identity map."""
+    db_session.expunge_all()
+    result = await db_session.execute(
+        select(PipelineRun).where(PipelineRun.id.in_([run.id for run in runs]))
+    )
+    by_id = {run.id: run for run in result.scalars()}
+    return [by_id[run.id] for run in runs]
+
+
+def _updates(statements: list[str]) -> list[str]:
+    return [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+
+
+class TestBulkTransition:
+    """bulk_transition moves many runs with one UPDATE per batch."""
+
+    async def test_uniform_stage_uses_plain_set(
+        self,
+        db_session: AsyncSession,
+        pipeline_runs: list[PipelineRun],
+        query_counter: list[str],
+    ):
+        query_counter.clear()
+
+        updated = await bulk_transition(
+            db_session, {run.id: PipelineStage.VERIFYING for run in pipeline_runs},
+        )
+        await db_session.commit()
+
+        assert updated == 5
+        [statement] = _updates(query_counter)
+        assert "CASE" not in statement.upper()
+
+        runs = await _load_runs(db_session, pipeline_runs)
+        assert {run.current_stage for run in runs} == {PipelineStage.VERIFYING}
+        assert {run.status for run in runs} == {PipelineRunStatus.RUNNING}
+
+    async def test_mixed_stages_use_case(
+        self,
+        db_session: AsyncSession,
+        pipeline_runs: list[PipelineRun],
+        query_counter: list[str],
+    ):
+        targets = [PipelineStage.DEVELOPING, PipelineStage.VERIFYING, PipelineStage.PO_REVIEW]
+        transitions = {
+            run.id: targets[i % len(targets)] for i, run in enumerate(pipeline_runs)
+        }
+        query_counter.clear()
+
+        updated = await bulk_transition(db_session, transitions)
+        await db_session.commit()
+
+        assert updated == 5
+        [statement] = _updates(query_counter)
+        assert "CASE" in statement.upper()
+
+        runs = await _load_runs(db_session, pipeline_runs)
+        assert [run.current_stage for run in runs] == list(transitions.values())
+
+    async def test_batches_by_size(
+        self,
+        db_session: AsyncSession,
+        pipeline_runs: list[PipelineRun],
+        query_counter: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(orchestrator, "BULK_TRANSITION_BATCH_SIZE", 2)
+        query_counter.clear()
+
+        updated = await bulk_transition(
+            db_session, {run.id: PipelineStage.VERIFYING for run in pipeline_runs},
+        )
+
+        assert updated == 5
+        assert len(_updates(query_counter)) == 3
+
+    async def test_finished_runs_skipped(
+        self,
+        db_session: AsyncSession,
+        pipeline_runs: list[PipelineRun],
+    ):
+        finished = pipeline_runs[:2]
+        for run, status in zip(
+            finished, (PipelineRunStatus.COMPLETED, PipelineRunStatus.CANCELLED), strict=True
+        ):
+            run.status = status
+        await db_session.commit()
+
+        updated = await bulk_transition(
+            db_session, {run.id: PipelineStage.FAILED for run in pipeline_runs},
+            status=PipelineRunStatus.FAILED,
+        )
+        await db_session.commit()
+
+        assert updated == 3
+        runs = await _load_runs(db_session, pipeline_runs)
+        assert [(run.current_stage, run.status) for run in runs[:2]] == [
+            (PipelineStage.TESTING, PipelineRunStatus.COMPLETED),
+            (PipelineStage.TESTING, PipelineRunStatus.CANCELLED),
+        ]
+        assert {(run.current_stage, run.status) for run in runs[2:]} == {
+            (PipelineStage.FAILED, PipelineRunStatus.FAILED),
+        }
+
+    async def test_terminal_status_stamps_completed_at(
+        self,
+        db_session: AsyncSession,
+        pipeline_runs: list[PipelineRun],
+    ):
+        cancelled, paused = pipeline_runs[0], pipeline_runs[1]
+
+        await bulk_transition(
+            db_session, {cancelled.id: PipelineStage.TESTING},
+            status=PipelineRunStatus.CANCELLED,
+        )
+        await bulk_transition(
+            db_session, {paused.id: PipelineStage.TESTING},
+            status=PipelineRunStatus.PAUSED,
+        )
+        await db_session.commit()
+
+        cancelled, paused = await _load_runs(db_session, [cancelled, paused])
+        assert cancelled.status == PipelineRunStatus.CANCELLED
+        assert cancelled.completed_at is not None
+        assert paused.status == PipelineRunStatus.PAUSED
+        assert paused.completed_at is None
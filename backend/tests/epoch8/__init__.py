@@ -0,0 +1,6 @@
+"""
+Epoch 8 - Visibility & Reliability Tests
+=========================================
+
+ACTIVE - Currently being implemented.
+"""
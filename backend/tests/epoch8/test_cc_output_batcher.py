@@ -0,0 +1,94 @@
+"""
+NH Mission Control - Epoch 8: CC Output Batching Tests
+=======================================================
+
+EPOCH 8 - ACTIVE
+
+CCOutputBatcher coalesces session output into one CC_OUTPUT_LINE event
+per max_lines lines or max_delay seconds; error lines go out on their own.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.nerve_center.events import EventType, NHEvent, Severity
+from src.core.pipeline.cc_session_manager import CCOutputBatcher
+
+MAX_DELAY = 0.02
+
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+@pytest.fixture
+def emitted() -> list[NHEvent]:
+    return []
+
+
+@pytest.fixture
+def batcher(emitted: list[NHEvent]) -> CCOutputBatcher:
+    async def emit_event(event: NHEvent):
+        emitted.append(event)
+
+    batcher = CCOutputBatcher(
+        emit_event, "cc-1", "worker", max_lines=4, max_delay=MAX_DELAY,
+    )
+    yield batcher
+    if batcher._timer is not None:
+        batcher._timer.cancel()
+
+
+# ==========================================================================
+# Batching Tests
+# ==========================================================================
+
+class TestCCOutputBatcher:
+    """When buffered output lines are emitted"""
+
+    async def test_lines_held_until_max_delay(
+        self, batcher: CCOutputBatcher, emitted: list[NHEvent]
+    ):
+        await batcher.add(10, "one")
+        await batcher.add(11, "two")
+        assert emitted == []
+
+        await asyncio.sleep(MAX_DELAY * 5)
+        assert len(emitted) == 1
+        event = emitted[0]
+        assert event.event_type == EventType.CC_OUTPUT_LINE
+        assert event.details["line_number"] == 10
+        assert event.details["lines"] == ["one", "two"]
+
+    async def test_full_batch_emitted_immediately(
+        self, batcher: CCOutputBatcher, emitted: list[NHEvent]
+    ):
+        for n in range(6):
+            await batcher.add(n, f"line {n}")
+
+        assert [e.details["lines"] for e in emitted] == [
+            ["line 0", "line 1", "line 2", "line 3"],
+        ]
+
+        # The remainder starts a new batch at its own first line
+        await asyncio.sleep(MAX_DELAY * 5)
+        assert len(emitted) == 2
+        assert emitted[1].details["line_number"] == 4
+        assert emitted[1].details["lines"] == ["line 4", "line 5"]
+
+    async def test_error_line_flushes_pending_and_goes_alone(
+        self, batcher: CCOutputBatcher, emitted: list[NHEvent]
+    ):
+        await batcher.add(1, "building")
+        await batcher.add(2, "Traceback", is_error=True)
+
+        assert [e.details["lines"] for e in emitted] == [["building"], ["Traceback"]]
+        assert emitted[0].severity == Severity.DEBUG
+        assert emitted[1].severity == Severity.ERROR
+        assert emitted[1].details["is_error"] is True
+        assert emitted[1].details["line_number"] == 2
+
+        # The flushed batch's timer was cancelled, so nothing repeats
+        await asyncio.sleep(MAX_DELAY * 5)
+        assert len(emitted) == 2
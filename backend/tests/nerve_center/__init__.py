@@ -0,0 +1,6 @@
+"""
+Nerve Center Tests
+==================
+
+Event batching and background delivery for the real-time layer.
+"""
@@ -0,0 +1,136 @@
+"""
+NH Nerve Center - Asset Registry Tests
+=======================================
+
+AssetRegistry keeps derived indexes (project status/priority, the
+capability index) in step with plain assignments to the assets it holds.
+"""
+
+import pytest
+
+from src.core.nerve_center.asset_registry import (
+    AIToolAsset,
+    AIToolCapability,
+    AssetRegistry,
+    AssetStatus,
+    HardwareAsset,
+    ProjectAsset,
+    ProjectStatus,
+    ServiceAsset,
+)
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+@pytest.fixture
+def registry() -> AssetRegistry:
+    registry = AssetRegistry()
+    registry.add_asset(AIToolAsset(
+        id="opus",
+        capabilities={AIToolCapability.ARCHITECTURE, AIToolCapability.CODE_REVIEW},
+    ))
+    registry.add_asset(AIToolAsset(
+        id="sonnet",
+        capabilities={AIToolCapability.CODE_REVIEW},
+    ))
+    return registry
+
+
+# ==========================================================================
+# Collection Tests
+# ==========================================================================
+
+class TestCollections:
+    """Collections are views over the single asset map"""
+
+    def test_constructor_collections_indexed(self):
+        registry = AssetRegistry(
+            hardware={"hw1": HardwareAsset(id="hw1")},
+            projects={"p1": ProjectAsset(id="p1", project_status=ProjectStatus.ACTIVE)},
+        )
+
+        assert registry.get_asset("hw1") is registry.hardware["hw1"]
+        assert [p.id for p in registry.get_active_projects()] == ["p1"]
+
+    @pytest.mark.parametrize(
+        "name", ["hardware", "services", "apis", "ai_tools", "projects", "infrastructure"],
+    )
+    def test_collections_are_read_only(self, registry: AssetRegistry, name: str):
+        with pytest.raises(TypeError):
+            getattr(registry, name)["hw1"] = HardwareAsset(id="hw1")
+
+    def test_readding_id_moves_collection(self, registry: AssetRegistry):
+        registry.add_asset(HardwareAsset(id="x"))
+        service = ServiceAsset(id="x")
+
+        registry.add_asset(service)
+
+        assert "x" not in registry.hardware
+        assert registry.services["x"] is service
+        assert registry.get_asset("x") is service
+
+    def test_reassigned_collection_reindexed(self, registry: AssetRegistry):
+        registry.add_asset(HardwareAsset(id="old"))
+
+        registry.hardware = {"new": HardwareAsset(id="new")}
+
+        assert registry.get_asset("old") is None
+        assert list(registry.hardware) == ["new"]
+        assert registry.get_asset("new") is registry.hardware["new"]
+
+
+# ==========================================================================
+# Capability Index Tests
+# ==========================================================================
+
+class TestCapabilityIndex:
+    """get_available_capabilities after tool changes"""
+
+    def test_lists_active_tools(self, registry: AssetRegistry):
+        assert registry.get_available_capabilities() == {
+            AIToolCapability.CODE_REVIEW: ["opus", "sonnet"],
+            AIToolCapability.ARCHITECTURE: ["opus"],
+        }
+
+    def test_deactivated_tool_dropped(self, registry: AssetRegistry):
+        registry.get_available_capabilities()
+
+        registry.ai_tools["opus"].status = AssetStatus.INACTIVE
+
+        assert registry.get_available_capabilities() == {
+            AIToolCapability.CODE_REVIEW: ["sonnet"],
+        }
+
+    def test_capability_change_picked_up(self, registry: AssetRegistry):
+        registry.get_available_capabilities()
+
+        registry.ai_tools["sonnet"].capabilities = [AIToolCapability.TESTING]
+
+        assert registry.ai_tools["sonnet"].capabilities == frozenset({AIToolCapability.TESTING})
+        assert registry.get_available_capabilities() == {
+            AIToolCapability.CODE_REVIEW: ["opus"],
+            AIToolCapability.ARCHITECTURE: ["opus"],
+            AIToolCapability.TESTING: ["sonnet"],
+        }
+
+    def test_removed_tool_stops_invalidating(self, registry: AssetRegistry):
+        tool = registry.remove_asset("opus")
+        assert registry.get_available_capabilities() == {
+            AIToolCapability.CODE_REVIEW: ["sonnet"],
+        }
+
+        tool.status = AssetStatus.INACTIVE
+        assert registry._capability_index is not None
+
+    def test_reassigned_ai_tools_reindexed(self, registry: AssetRegistry):
+        registry.get_available_capabilities()
+
+        registry.ai_tools = {"gemini": AIToolAsset(
+            id="gemini", capabilities={AIToolCapability.RESEARCH},
+        )}
+
+        assert registry.get_asset("opus") is None
+        assert registry.get_available_capabilities() == {
+            AIToolCapability.RESEARCH: ["gemini"],
+        }
@@ -0,0 +1,104 @@
+"""
+NH Nerve Center - SyncWave Notification Queue Tests
+====================================================
+
+SyncWaveClient queues send_task_* / send_blocker_alert notifications and
+delivers them from background workers; flush() and aclose() wait for them.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.nerve_center import dispatcher
+from src.core.nerve_center.dispatcher import (
+    AITool,
+    DispatchTask,
+    SyncWaveClient,
+    SyncWaveNotification,
+)
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+class RecordingClient(SyncWaveClient):
+    """Records delivered notifications instead of posting them"""
+
+    def __init__(self):
+        super().__init__(api_url="http://syncwave.test", api_key="")
+        self.delivered: list[SyncWaveNotification] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def send_notification(self, notification: SyncWaveNotification) -> bool:
+        await self.gate.wait()
+        if notification.title == "boom":
+            raise RuntimeError("delivery failed")
+        self.delivered.append(notification)
+        return True
+
+
+@pytest.fixture
+async def client() -> RecordingClient:
+    client = RecordingClient()
+    yield client
+    client.gate.set()
+    await client.aclose()
+
+
+# ==========================================================================
+# Queue Tests
+# ==========================================================================
+
+class TestNotificationQueue:
+    """Background delivery of queued notifications"""
+
+    async def test_send_returns_before_delivery(self, client: RecordingClient):
+        client.gate.clear()
+        task = DispatchTask(title="Refactor", assigned_tool=AITool.CLAUDE_SONNET)
+
+        await client.send_task_started(task)
+        await asyncio.sleep(0)
+        assert client.delivered == []
+
+        client.gate.set()
+        await client.flush()
+        assert [n.data["task_id"] for n in client.delivered] == [task.id]
+
+    async def test_full_queue_drops_oldest(
+        self, client: RecordingClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(dispatcher, "NOTIFICATION_QUEUE_SIZE", 2)
+        monkeypatch.setattr(dispatcher, "NOTIFICATION_WORKERS", 1)
+
+        # No await yields to the worker in between, so the queue only fills
+        for i in range(4):
+            await client.send_blocker_alert(f"project-{i}", "blocked", "retry")
+
+        await client.flush()
+        assert client.dropped_notifications == 2
+        assert [n.data["project_id"] for n in client.delivered] == [
+            "project-2", "project-3",
+        ]
+
+    async def test_failed_delivery_keeps_worker_running(
+        self, client: RecordingClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(dispatcher, "NOTIFICATION_WORKERS", 1)
+
+        client._enqueue(SyncWaveNotification(title="boom", body=""))
+        client._enqueue(SyncWaveNotification(title="after", body=""))
+
+        await client.flush()
+        assert [n.title for n in client.delivered] == ["after"]
+
+    async def test_aclose_delivers_queued_then_stops_workers(self, client: RecordingClient):
+        for i in range(3):
+            await client.send_blocker_alert(f"project-{i}", "blocked", "retry")
+        workers = list(client._workers)
+
+        await client.aclose()
+        assert len(client.delivered) == 3
+        assert all(worker.done() for worker in workers)
+        assert client._queue is None
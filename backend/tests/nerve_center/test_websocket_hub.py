@@ -0,0 +1,167 @@
+"""
+NH Nerve Center - WebSocket Hub Tests
+======================================
+
+Broadcast batching in ConnectionManager: events are held for up to
+EVENT_FLUSH_INTERVAL or EVENT_FLUSH_BATCH events, errors go out at once,
+and each client gets one message per flush.
+"""
+
+import asyncio
+import json
+
+import pytest
+from starlette.websockets import WebSocketState
+
+from src.core.nerve_center.events import EventCategory, EventType, NHEvent, Severity
+from src.core.nerve_center.websocket_hub import (
+    EVENT_FLUSH_BATCH,
+    EVENT_FLUSH_INTERVAL,
+    ConnectionManager,
+    WSMessageType,
+)
+
+# ==========================================================================
+# Fixtures
+# ==========================================================================
+
+class FakeWebSocket:
+    """Records every message sent to it, decoded"""
+
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.sent: list[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        self.sent.append(json.loads(text))
+
+    def types(self) -> list[str]:
+        return [message["type"] for message in self.sent]
+
+
+@pytest.fixture
+def manager() -> ConnectionManager:
+    """A fresh ConnectionManager, bypassing the singleton"""
+    ConnectionManager._instance = None
+    manager = ConnectionManager()
+    yield manager
+    if manager._flush_task is not None:
+        manager._flush_task.cancel()
+    ConnectionManager._instance = None
+
+
+async def connect(manager: ConnectionManager, **filters) -> FakeWebSocket:
+    """Connect a fake client, apply its filters and drop the CONNECTED message"""
+    websocket = FakeWebSocket()
+    client_id = await manager.connect(websocket)
+    for key, value in filters.items():
+        setattr(manager.connections[client_id], key, value)
+    websocket.sent.clear()
+    return websocket
+
+
+def make_event(severity: Severity = Severity.INFO, **kwargs) -> NHEvent:
+    return NHEvent(category=EventCategory.AGENT, severity=severity, **kwargs)
+
+
+# ==========================================================================
+# Flush Timing
+# ==========================================================================
+
+class TestFlushTiming:
+    """When queued events are broadcast"""
+
+    async def test_event_held_until_flush_interval(self, manager: ConnectionManager):
+        websocket = await connect(manager)
+
+        await manager.emit_event(make_event())
+        assert websocket.sent == []
+
+        await asyncio.sleep(EVENT_FLUSH_INTERVAL * 5)
+        assert websocket.types() == [WSMessageType.EVENT.value]
+
+    async def test_full_batch_flushes_immediately(self, manager: ConnectionManager):
+        websocket = await connect(manager)
+
+        for _ in range(EVENT_FLUSH_BATCH - 1):
+            await manager.emit_event(make_event())
+        assert websocket.sent == []
+
+        await manager.emit_event(make_event())
+        assert websocket.types() == [WSMessageType.EVENT_BATCH.value]
+        assert len(websocket.sent[0]["payload"]) == EVENT_FLUSH_BATCH
+        assert manager._flush_task is None
+
+    @pytest.mark.parametrize("severity", [Severity.ERROR, Severity.CRITICAL])
+    async def test_urgent_event_flushes_queue_immediately(
+        self, manager: ConnectionManager, severity: Severity
+    ):
+        websocket = await connect(manager)
+
+        held = make_event()
+        urgent = make_event(severity)
+        await manager.emit_event(held)
+        await manager.emit_event(urgent)
+
+        # The urgent event takes the already queued one with it, in order
+        assert websocket.types() == [WSMessageType.EVENT_BATCH.value]
+        assert [e["id"] for e in websocket.sent[0]["payload"]] == [held.id, urgent.id]
+
+        # Nothing is left for the cancelled timer to send
+        await asyncio.sleep(EVENT_FLUSH_INTERVAL * 5)
+        assert len(websocket.sent) == 1
+
+
+# ==========================================================================
+# Per-Client Messages
+# ==========================================================================
+
+class TestClientMessages:
+    """What each client receives from a flush"""
+
+    async def test_filters_choose_event_or_event_batch(self, manager: ConnectionManager):
+        info = make_event(Severity.INFO, session_id="session-a")
+        warning = make_event(Severity.WARNING, session_id="session-b")
+
+        everything = await connect(manager)
+        session_a = await connect(manager, subscribed_sessions={"session-a"})
+        warnings = await connect(manager, filter_severity=Severity.WARNING)
+        errors = await connect(manager, filter_severity=Severity.ERROR)
+
+        manager._pending_events.extend([info, warning])
+        await manager.flush_events()
+
+        assert everything.types() == [WSMessageType.EVENT_BATCH.value]
+        assert [e["id"] for e in everything.sent[0]["payload"]] == [info.id, warning.id]
+
+        assert session_a.types() == [WSMessageType.EVENT.value]
+        assert session_a.sent[0]["payload"]["id"] == info.id
+
+        assert warnings.types() == [WSMessageType.EVENT.value]
+        assert warnings.sent[0]["payload"]["id"] == warning.id
+
+        assert errors.sent == []
+
+    async def test_dirty_session_state_sent_once_per_flush(self, manager: ConnectionManager):
+        session_id = manager.create_session("batch")
+        websocket = await connect(manager)
+
+        for _ in range(3):
+            await manager.emit_event(make_event(
+                event_type=EventType.TASK_COMPLETE, session_id=session_id,
+            ))
+        await manager.flush_events()
+
+        # State goes out ahead of the events that changed it
+        assert websocket.types() == [
+            WSMessageType.STATE.value,
+            WSMessageType.EVENT_BATCH.value,
+        ]
+        assert websocket.sent[0]["payload"]["completed_tasks"] == 3
+
+        # A flush with nothing new sends nothing
+        await manager.flush_events()
+        assert len(websocket.sent) == 2
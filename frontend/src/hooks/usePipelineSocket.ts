@@ -263,6 +263,12 @@ export function usePipelineSocket({
 
           if (msg.type === 'event' && msg.payload?.category === 'pipeline') {
             processEvent(msg.payload as PipelineEvent);
+          } else if (msg.type === 'event_batch') {
+            for (const payload of msg.payload) {
+              if (payload?.category === 'pipeline') {
+                processEvent(payload as PipelineEvent);
+              }
+            }
           }
         } catch (e) {
           console.warn('[PipelineSocket] Failed to parse message:', e);
@@ -681,6 +681,8 @@ export default function NerveCenter({ sessionId, wsUrl = 'ws://localhost:8000/ap
           
           if (msg.type === 'event') {
             setEvents(prev => [...prev.slice(-999), msg.payload]);
+          } else if (msg.type === 'event_batch') {
+            setEvents(prev => [...prev, ...msg.payload].slice(-1000));
           } else if (msg.type === 'state') {
             setSession(msg.payload);
           } else if (msg.type === 'connected') {